@@ -1,25 +1,48 @@
 """This file runs the Problem 1 Example and
-writes the output to a separate text file."""
+writes the output to separate text and npz files."""
 
 import time
 from pathlib import Path
 
+import numpy
+
 from kinetic_project.graphs.generate_random_graph import (
     generate_random_directed_graph,
 )
-from kinetic_project.graphs.graph_ops import iterate_subgraphs
+from kinetic_project.graphs.graph_ops import (
+    compile_kernels,
+    iterate_subgraphs,
+)
 
 
 def main():
     """The main function to be run."""
     G = generate_random_directed_graph(v=10, e=20, seed=2)
+    script_start_time = start_time = time.time()
+    # Loads the kernels from the on-disk cache, or compiles them:
+    compile_kernels()
+    print(f"Kernel compilation time: {(time.time()-start_time)/60} min")
     start_time = time.time()
     subgraphs = iterate_subgraphs(G, k=10, v=2)
     print(f"Subgraph iteration time: {(time.time()-start_time)/60} min")
-    outfilename = Path(__file__).name + ".txt"
-    with open(outfilename, "w", encoding="utf8") as file:
-        file.write(str(subgraphs))
-    print(f"Total script time: {(time.time()-start_time)/60} min")
+    outfilename = Path(__file__).name
+    numpy.savez_compressed(
+        outfilename + ".npz",
+        **{
+            f"{name}_{i}": arr
+            for i, subgraph in enumerate(subgraphs)
+            for name, arr in zip(("A", "verts"), subgraph)
+        },
+    )
+    with open(
+        outfilename + ".txt", "w", encoding="utf8", buffering=1 << 20
+    ) as file:
+        # The text of str(subgraphs), written a subgraph at a time:
+        file.write("[")
+        for i, subgraph in enumerate(subgraphs):
+            file.write(f"{', ' if i else ''}{subgraph!r}")
+        file.write("]")
+    print(f"Total script time: {(time.time()-script_start_time)/60} min")
 
 
 if __name__ == "__main__":
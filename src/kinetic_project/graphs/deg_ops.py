@@ -6,7 +6,9 @@ from enum import Enum
 import networkx
 import numpy
 
-from kinetic_project.graphs.graph_dimen_type_val import dimen_type_val
+from kinetic_project.graphs.graph_dimen_type_val import (
+    _dimen_type_val_nocopy,
+)
 
 
 class AllowedDegs(Enum):
@@ -41,7 +43,8 @@ def in_or_out_deg(
     Raises:
         ValueError: If in_or_out is not "in" or "out".
     """
-    A, verts = dimen_type_val(G, verts)
+    # The degrees are only read from A, so it does not need to be copied:
+    A, verts = _dimen_type_val_nocopy(G, verts)
     if in_or_out not in AllowedDegs:
         raise ValueError(f"{in_or_out} is not in {AllowedDegs}.")
     # This method is incorrect:
@@ -52,12 +55,57 @@ def in_or_out_deg(
     #     return numpy.array([[verts[ind]*sum(A[ind,:])] for ind in range(verts.shape[0])])
     # return numpy.array([[verts[ind]*sum(A[:,ind])] for ind in range(verts.shape[0])])
     if in_or_out == AllowedDegs.IN:
-        return numpy.array(
-            [verts[ind] * sum(A[ind, :]) for ind in range(verts.shape[0])]
-        )
-    return numpy.array(
-        [verts[ind] * sum(A[:, ind]) for ind in range(verts.shape[0])]
-    )
+        return _in_deg_arr(A, verts)
+    return _out_deg_arr(A, verts)
+
+
+def _in_deg_arr(A: numpy.ndarray, verts: numpy.ndarray) -> numpy.ndarray:
+    """Calculates the in-degree for each vertex of an
+    already validated adjacency matrix, without any
+    type checks or conversions.
+
+    Args:
+        A (numpy.ndarray): The adjacency matrix.
+        verts (numpy.ndarray): A vector representing
+            the active vertices in the graph.
+
+    Returns:
+        numpy.ndarray: A vector of in-degrees.
+    """
+    return _active_degs(A.sum(axis=1), verts)
+
+
+def _out_deg_arr(A: numpy.ndarray, verts: numpy.ndarray) -> numpy.ndarray:
+    """Calculates the out-degree for each vertex of an
+    already validated adjacency matrix, without any
+    type checks or conversions.
+
+    Args:
+        A (numpy.ndarray): The adjacency matrix.
+        verts (numpy.ndarray): A vector representing
+            the active vertices in the graph.
+
+    Returns:
+        numpy.ndarray: A vector of out-degrees.
+    """
+    return _active_degs(A.sum(axis=0), verts)
+
+
+def _active_degs(degs: numpy.ndarray, verts: numpy.ndarray) -> numpy.ndarray:
+    """Zeroes the degrees of inactive vertices.
+
+    Args:
+        degs (numpy.ndarray): A vector of degrees.
+        verts (numpy.ndarray): A vector representing
+            the active vertices in the graph.
+
+    Returns:
+        numpy.ndarray: The degrees of the active vertices.
+    """
+    # All vertices are active unless verts was passed in:
+    if numpy.all(verts):
+        return degs
+    return degs * verts
 
 
 def in_deg(
@@ -102,3 +150,36 @@ def out_deg(
 
     """
     return in_or_out_deg(G, AllowedDegs.OUT, verts)
+
+
+def csr_in_deg(indptr: numpy.ndarray) -> numpy.ndarray:
+    """Calculates the number of edges into each
+    vertex of a graph in CSR representation, which
+    are the elements of its row of the adjacency
+    matrix, as for in_deg.
+
+    Args:
+        indptr (numpy.ndarray): The CSR index pointer
+            array of the graph.
+
+    Returns:
+        numpy.ndarray: A vector of in-degrees.
+    """
+    return numpy.diff(indptr)
+
+
+def csr_out_deg(indices: numpy.ndarray, dim: int) -> numpy.ndarray:
+    """Calculates the number of edges out of each
+    vertex of a graph in CSR representation, which
+    are the elements of its column of the adjacency
+    matrix, as for out_deg.
+
+    Args:
+        indices (numpy.ndarray): The CSR column indices
+            array of the graph.
+        dim (int): The number of vertices in the graph.
+
+    Returns:
+        numpy.ndarray: A vector of out-degrees.
+    """
+    return numpy.bincount(indices, minlength=dim)
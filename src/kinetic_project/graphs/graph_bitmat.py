@@ -0,0 +1,136 @@
+"""This file contains code for the converting of
+a graph's adjacency matrix to a bitmatrix and back,
+for graphs with at most 64 vertices, and of the
+bitsets of active vertices used by graph_ops."""
+
+import numpy
+
+from kinetic_project.jit import njit
+
+MAX_BITMAT_DIM = 64
+
+
+def from_numpy(A: numpy.ndarray) -> numpy.ndarray:
+    """This function converts a numpy.ndarray
+    representation of a graph's adjacency matrix
+    into a bitmatrix, where bit j of row i is set
+    if A[i, j] is nonzero.
+
+    Args:
+        A (numpy.ndarray): Adjacency matrix to
+            convert.
+
+    Returns:
+        numpy.ndarray: The rows of the bitmatrix,
+            as an array of uint64 words.
+
+    Raises:
+        ValueError: If A has more than 64 vertices.
+    """
+    if (dim := A.shape[0]) > MAX_BITMAT_DIM:
+        raise ValueError(
+            f"{dim} vertices do not fit in a {MAX_BITMAT_DIM} bit word."
+        )
+    weights = numpy.left_shift(
+        numpy.uint64(1), numpy.arange(dim, dtype=numpy.uint64)
+    )
+    return numpy.bitwise_or.reduce(
+        numpy.where(A != 0, weights, numpy.uint64(0)), axis=1
+    )
+
+
+def to_numpy(rows: numpy.ndarray, dim: int) -> numpy.ndarray:
+    """This function converts a bitmatrix into
+    a boolean adjacency matrix.
+
+    Args:
+        rows (numpy.ndarray): The rows of the
+            bitmatrix, as an array of uint64 words.
+        dim (int): The number of vertices in the graph.
+
+    Returns:
+        numpy.ndarray: The boolean adjacency matrix.
+    """
+    shifts = numpy.arange(dim, dtype=numpy.uint64)
+    return (rows[:, None] >> shifts) & numpy.uint64(1) != 0
+
+
+@njit(cache=True)
+def popcount(x: numpy.uint64) -> numpy.uint64:
+    """This function counts the number of set bits
+    in a uint64 word, without branching or looping
+    over the bits.
+
+    Args:
+        x (numpy.uint64): The word.
+
+    Returns:
+        numpy.uint64: The number of set bits.
+    """
+    x = x - ((x >> numpy.uint64(1)) & numpy.uint64(0x5555555555555555))
+    x = (x & numpy.uint64(0x3333333333333333)) + (
+        (x >> numpy.uint64(2)) & numpy.uint64(0x3333333333333333)
+    )
+    x = (x + (x >> numpy.uint64(4))) & numpy.uint64(0x0F0F0F0F0F0F0F0F)
+    x = x + (x >> numpy.uint64(8))
+    x = x + (x >> numpy.uint64(16))
+    x = x + (x >> numpy.uint64(32))
+    return x & numpy.uint64(0x7F)
+
+
+@njit(cache=True)
+def bit_is_set(bits: numpy.ndarray, i: int) -> bool:
+    """This function checks whether a bit is set
+    in a bitset.
+
+    Args:
+        bits (numpy.ndarray): The bitset, as an
+            array of uint64 words.
+        i (int): The index of the bit to check.
+
+    Returns:
+        bool: Whether the bit is set (True), or not (False).
+    """
+    return (bits[i >> 6] >> numpy.uint64(i & 63)) & numpy.uint64(1) != 0
+
+
+def verts_to_bits(verts: numpy.ndarray) -> numpy.ndarray:
+    """This function converts a vector representing the
+    active vertices in a graph into a bitset.
+
+    Args:
+        verts (numpy.ndarray): A vector representing
+            the active vertices in the graph.
+
+    Returns:
+        numpy.ndarray: The bitset, as an array of
+            uint64 words, where bit i is set if vertex
+            i is active. Graphs with at most 64 vertices
+            fit in a single word.
+    """
+    inds = numpy.nonzero(numpy.ravel(verts))[0]
+    bits = numpy.zeros((numpy.size(verts) + 63) // 64, dtype=numpy.uint64)
+    numpy.bitwise_or.at(
+        bits,
+        inds >> 6,
+        numpy.left_shift(numpy.uint64(1), (inds & 63).astype(numpy.uint64)),
+    )
+    return bits
+
+
+def bits_to_verts(bits: numpy.ndarray, dim: int) -> numpy.ndarray:
+    """This function converts a bitset into a vector
+    representing the active vertices in a graph.
+
+    Args:
+        bits (numpy.ndarray): The bitset, as an
+            array of uint64 words.
+        dim (int): The number of vertices in the graph.
+
+    Returns:
+        numpy.ndarray: The (uint8) vector representing
+            the active vertices in the graph.
+    """
+    inds = numpy.arange(dim)
+    bits_out = bits[inds >> 6] >> (inds & 63).astype(numpy.uint64)
+    return (bits_out & numpy.uint64(1)).astype(numpy.uint8)
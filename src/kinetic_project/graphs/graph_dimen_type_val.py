@@ -15,7 +15,8 @@ def dimen_type_val(
 ) -> tuple[numpy.ndarray, numpy.ndarray]:
     """This function validates the dimensions and
     types of input objects, and creates the verts
-    array if it is not passed in.
+    array if it is not passed in. The verts array
+    is returned as a 1-D uint8 mask.
 
     Args:
         G (networkx.Graph | numpy.ndarray): The graph,
@@ -32,19 +33,49 @@ def dimen_type_val(
 
     Raises:
         ValueError: If the shape of the numpy.ndarray
-            for verts is not (n by 1), where n is the
-            dimension of the adjacency matrix for G.
+            for verts is not (n) or (n by 1), where n is
+            the dimension of the adjacency matrix for G.
     """
-    A, dim = graph_dimen_type_val(G)
+    A, _ = graph_dimen_type_val(G)
+    return _dimen_type_val_nocopy(A, verts)
+
+
+def _dimen_type_val_nocopy(
+    G: networkx.Graph | numpy.ndarray,
+    verts: numpy.ndarray | None = None,
+) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """This function performs the same validation as
+    dimen_type_val, but without copying a numpy
+    adjacency matrix. It should only be used when
+    the returned adjacency matrix is not modified,
+    or is owned by the caller.
+
+    Args:
+        G (networkx.Graph | numpy.ndarray): The graph,
+            represented as a networkx.Graph or
+            a numpy adjacency matrix.
+        verts (numpy.ndarray | None): A vector
+            representing the active vertices in the
+            graph. If None, a vector of ones will
+            be created. Defaults to None.
+
+    Returns:
+        (numpy.ndarray, numpy.ndarray): The validated
+            adjacency matrix and verts vector.
+    """
+    A, dim = graph_dimen_type_val(G, copy=False)
     if verts is None:
-        verts = numpy.ones((dim, 1))
-    elif verts.shape != (dim, 1):
-        raise ValueError(f"{verts.shape} is not {(dim,1)}.")
+        verts = numpy.ones(dim, dtype=numpy.uint8)
+    elif verts.shape in ((dim,), (dim, 1)):
+        verts = (verts.reshape(dim) != 0).astype(numpy.uint8, copy=False)
+    else:
+        raise ValueError(f"{verts.shape} is not {(dim,)}.")
     return (A, verts)
 
 
 def graph_dimen_type_val(
     G: networkx.Graph | numpy.ndarray,
+    copy: bool = True,
 ) -> tuple[numpy.ndarray, int]:
     """This function validates the dimensions and type
     of the input graph.
@@ -53,6 +84,9 @@ def graph_dimen_type_val(
         G (networkx.Graph | numpy.ndarray): The graph,
             represented as a networkx.Graph or
             a numpy adjacency matrix.
+        copy (bool): Whether to return a copy of a numpy
+            adjacency matrix (True), or the original
+            matrix (False). Defaults to True.
 
     Returns:
         (numpy.ndarray, int): The validated
@@ -62,7 +96,12 @@ def graph_dimen_type_val(
         ValueError: If the shape of the numpy.ndarray
             for G is not square.
     """
-    A = graph_to_mat(G) if isinstance(G, networkx.Graph) else G.copy()
+    if isinstance(G, networkx.Graph):
+        A = graph_to_mat(G)
+    elif copy:
+        A = G.copy()
+    else:
+        A = G
     dim1, dim2 = A.shape
     if dim1 == dim2:
         dim = dim1
@@ -3,19 +3,31 @@ a networkx graph to its adjacency matrix and back."""
 
 import networkx
 import numpy
+import scipy.sparse
 
 
 def graph_to_mat(G: networkx.Graph) -> numpy.ndarray:
     """This function converts a networkx.Graph
     into its adjacency matrix representation.
+    Each element is the number of edges from
+    one vertex to another, whatever their
+    weights, as the subgraphs only depend on
+    which edges there are.
 
     Args:
         G (networkx.Graph): Graph to convert.
 
     Returns:
-        numpy.ndarray: Adjacency matrix of G.
+        numpy.ndarray: Adjacency matrix of G, of
+            dtype numpy.uint8, or numpy.int64 for a
+            multigraph, whose parallel edges may not
+            fit in a uint8.
     """
-    return networkx.to_numpy_array(G)
+    return networkx.to_numpy_array(
+        G,
+        weight=None,
+        dtype=numpy.int64 if G.is_multigraph() else numpy.uint8,
+    )
 
 
 def mat_to_graph(
@@ -43,3 +55,40 @@ def mat_to_graph(
         create_using=networkx.DiGraph,
         nodelist=vertex_labels,
     )
+
+
+def mat_to_csr(
+    A: numpy.ndarray | scipy.sparse.sparray | scipy.sparse.spmatrix,
+) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """This function converts a numpy.ndarray or
+    scipy sparse representation of a graph's adjacency
+    matrix into a compressed sparse row (CSR)
+    representation. A sparse matrix is not densified,
+    and only its stored nonzero values are edges.
+
+    Args:
+        A (numpy.ndarray | scipy.sparse.sparray |
+            scipy.sparse.spmatrix): Adjacency matrix to
+            convert.
+
+    Returns:
+        (numpy.ndarray, numpy.ndarray): The CSR index
+            pointer array (of length n+1), and the column
+            indices array (of length e), where n is the
+            dimension of A and e is the number of nonzero
+            elements in A. The columns of the edges
+            out of vertex i are given by
+            indices[indptr[i]:indptr[i+1]].
+    """
+    if scipy.sparse.issparse(A):
+        csr = scipy.sparse.csr_array(A, copy=True)
+        csr.eliminate_zeros()
+        csr.sort_indices()
+        return (
+            csr.indptr.astype(numpy.int64),
+            csr.indices.astype(numpy.int64),
+        )
+    rows, cols = numpy.nonzero(A)
+    indptr = numpy.zeros(A.shape[0] + 1, dtype=numpy.int64)
+    numpy.cumsum(numpy.bincount(rows, minlength=A.shape[0]), out=indptr[1:])
+    return (indptr, cols.astype(numpy.int64))
@@ -1,37 +1,77 @@
 """This file contains functions to be performed
 on graph adjacency matrices."""
 
+import os
+from multiprocessing import Pool
+from typing import Any
+
 import networkx
 import numpy
+import scipy.sparse
 
-from kinetic_project.graphs.deg_ops import in_deg, out_deg
-from kinetic_project.graphs.graph_dimen_type_val import dimen_type_val
+from kinetic_project.graphs.deg_ops import (
+    csr_in_deg,
+    csr_out_deg,
+)
+from kinetic_project.graphs.graph_bitmat import (
+    MAX_BITMAT_DIM,
+    bit_is_set,
+    bits_to_verts,
+    from_numpy,
+    popcount,
+    to_numpy,
+    verts_to_bits,
+)
+from kinetic_project.graphs.graph_dimen_type_val import (
+    _dimen_type_val_nocopy,
+    dimen_type_val,
+)
+from kinetic_project.graphs.graph_mat_conversions import mat_to_csr
+from kinetic_project.graphs.graph_sparse import (
+    csr_subgraph,
+    prune_sparse,
+    zero_rows_and_cols_sparse,
+)
+from kinetic_project.jit import List, njit
 
 
-def iterate_subgraphs(
-    G: numpy.ndarray | networkx.Graph,
+def iterate_subgraphs(  # pylint: disable=too-many-locals
+    G: (
+        numpy.ndarray
+        | networkx.Graph
+        | scipy.sparse.sparray
+        | scipy.sparse.spmatrix
+    ),
     verts: numpy.ndarray | None = None,
     k: int | None = None,
     v: int | list[int] | None = None,
-    hashmap: dict | None = None,
-) -> list[tuple[numpy.ndarray, numpy.ndarray]]:
+    max_workers: int | None = 1,
+) -> list[tuple[numpy.ndarray | scipy.sparse.csr_array, numpy.ndarray]]:
     """This function validates conditions on a
     graph, and then iterates through and validates
-    conditions on all the subgraphs recursively,
-    by iteratively removing one edge from the graph.
+    conditions on all the subgraphs.
+    The graph is converted once to a CSR representation,
+    which is iterated through by compiled (numba) code,
+    and the edges are decided in order: every subgraph
+    either keeps the next undecided edge or does not,
+    so that each valid subgraph is found exactly once
+    and no hashmap of checked subgraphs is needed.
 
     Args:
-        G (networkx.Graph | numpy.ndarray): The graph,
-            represented as a networkx.Graph or
-            a numpy adjacency matrix.
+        G (networkx.Graph | numpy.ndarray |
+            scipy.sparse.sparray | scipy.sparse.spmatrix):
+            The graph, represented as a networkx.Graph,
+            or a numpy or scipy sparse adjacency matrix.
         verts (numpy.ndarray | None): A vector
             representing the active vertices in the
             graph. If None, a vector of ones will
             be created. Defaults to None.
         k (int | None): 1 + maximum number of edges allowed
-            in a valid subgraph. If None, set to one more
-            than the number of edges in the graph. Defaults
-            to None.
+            in a valid subgraph, where an element of n in the
+            adjacency matrix counts as n edges. Every valid
+            subgraph has more than one edge. If None, set to
+            one more than the number of edges in the graph.
+            Defaults to None.
         v (in | list[int] | None): Vertices which
             must be included in subgraphs for the
             subgraphs to be considered valid. Each
@@ -40,81 +80,752 @@ def iterate_subgraphs(
             specific vertex is required to be in a
             subgraph for the subgraph to be considered
             valid. Defaults to None.
-        hashmap (dict | None): Hashmap of subgraphs that
-            have been checked. If None, a hashmap is
-            created. Defaults to None.
+        max_workers (int | None): Maximum number of
+            parallel processes to iterate through
+            independent branches of subgraphs with.
+            If None, uses the number of available
+            CPUs on the system. Defaults to 1, which
+            does not start any processes.
 
     Returns:
         list: list of tuples of valid subgraphs and
-            their corresponding vertex lists.
-    """
-    A, verts = dimen_type_val(G, verts)
-    if hashmap is None:
-        hashmap = {}
-    if k is None:
-        k = sum(sum(A)) + 1
-    subgraph_list: list = []
-    A, verts = validate_graph_sink_source_condition(A, v=v)
-    # key = (tuple(A), tuple(verts))
-    # if key in hashmap:
-    if (key := (str(A), str(verts))) in hashmap:
-        return subgraph_list
-    hashmap[key] = 1
-    if 1 < sum(sum(A)) < k:
-        subgraph_list.append(prune_graph(A, verts))
-    for i, j in numpy.argwhere(A):
-        # If I just reduce each individual edge to 0,
-        # I may miss subgraphs in the case when there
-        # are multiple edges going from one vertex to
-        # another, i.e., when the value of the element
-        # in the adjacency matrix is >1.
-        this_A, this_verts = A.copy(), verts.copy()
-        this_A[i, j] = 0
-        this_A, this_verts = validate_graph_sink_source_condition(
-            this_A, this_verts, v
+            their corresponding vertex lists. The
+            subgraphs of a sparse matrix are CSR arrays.
+    """
+    # A is only read from, since the edges are removed
+    # from the CSR representation instead:
+    A, verts = _dimen_type_val_nocopy(G, verts)
+    # The values of the subgraphs of a sparse matrix are read by row:
+    sparse_mat = (
+        scipy.sparse.csr_array(A) if scipy.sparse.issparse(A) else None
+    )
+    indptr, indices = _csr_drop_vertices(
+        *mat_to_csr(A), numpy.nonzero(verts == 0)[0]
+    )
+    in_d, out_d = csr_in_deg(indptr), csr_out_deg(indices, len(verts))
+    required = numpy.array(
+        v if v is not None else [], dtype=numpy.int64
+    ).reshape(-1)
+    indptr, indices, bits = _csr_validate_sink_source_nb(
+        indptr, indices, verts_to_bits(verts), in_d, out_d, required
+    )
+    # The iteration counts the nonzero elements of the subgraphs, which
+    # are at most their sums when every element is at least 1, so that
+    # k bounds the count as well; the sums are checked after pruning:
+    values = A if sparse_mat is None else sparse_mat.data
+    counted_k = (
+        k
+        if k is not None and bool(numpy.all((values == 0) | (values >= 1)))
+        else len(indices) + 1
+    )
+    if (dim := len(verts)) <= MAX_BITMAT_DIM:
+        # Small graphs fit in a bitmatrix of one uint64 word per row,
+        # and in a dense matrix:
+        if sparse_mat is not None:
+            A = sparse_mat.toarray()
+        active = bits_to_verts(bits, dim) != 0
+        required_bits = verts_to_bits(numpy.isin(numpy.arange(dim), required))
+        subgraphs = _iterate_subgraphs_parallel(
+            True,
+            (
+                numpy.where(active, from_numpy(A) & bits[0], numpy.uint64(0)),
+                bits[0],
+                0,
+                0,
+                len(indices),
+            ),
+            counted_k,
+            required_bits[0],
+            max_workers,
         )
-        subgraph_list.extend(
-            iterate_subgraphs(this_A, this_verts, k, v, hashmap)
+        pruned = _within_edge_budget(
+            [
+                _prune_graph_arr(
+                    numpy.where(to_numpy(this_rows, dim), A, 0),
+                    bits_to_verts(
+                        numpy.array([this_verts], dtype=numpy.uint64), dim
+                    ),
+                )
+                for this_rows, this_verts in subgraphs
+            ],
+            k,
         )
-    return subgraph_list
+        if sparse_mat is None:
+            return pruned
+        return [
+            (scipy.sparse.csr_array(sub_A), labels) for sub_A, labels in pruned
+        ]
+    subgraphs = _iterate_subgraphs_parallel(
+        False,
+        (indptr, indices, bits, in_d, out_d, 0),
+        counted_k,
+        required,
+        max_workers,
+    )
+    return _within_edge_budget(
+        [
+            _csr_prune_graph(
+                A if sparse_mat is None else sparse_mat,
+                this_indptr,
+                this_indices,
+                bits_to_verts(this_verts, dim),
+            )
+            for this_indptr, this_indices, this_verts in subgraphs
+        ],
+        k,
+    )
 
 
-def prune_graph(
-    A: numpy.ndarray | networkx.Graph,
+def _within_edge_budget(
+    subgraphs: list[tuple],
+    k: int | None,
+) -> list[tuple]:
+    """This function keeps the subgraphs whose number
+    of edges is within the limits of iterate_subgraphs,
+    where an element of n in the adjacency matrix counts
+    as n edges.
+
+    Args:
+        subgraphs (list[tuple]): list of tuples of
+            subgraphs and their corresponding vertex lists.
+        k (int | None): 1 + maximum number of edges allowed
+            in a valid subgraph. If None, there is no maximum.
+
+    Returns:
+        list[tuple]: The subgraphs with more than one
+            edge, and fewer than k edges.
+    """
+    return [
+        (sub_A, labels)
+        for sub_A, labels in subgraphs
+        if (n_edges := sub_A.sum()) > 1 and (k is None or n_edges < k)
+    ]
+
+
+def compile_kernels() -> None:
+    """This function compiles the numba kernels used by
+    iterate_subgraphs, for both the bitmatrix (at most 64
+    vertices) and CSR representations, by iterating through
+    the subgraphs of small graphs. The kernels are cached on
+    disk, so later processes load them instead of compiling
+    them again. Calling this function ahead of a one-off run
+    (e.g., when building an environment) removes the
+    compilation from the run itself. Without numba, this
+    function has no lasting effect.
+    """
+    for dim in (3, MAX_BITMAT_DIM + 1):
+        A = numpy.zeros((dim, dim), dtype=numpy.int8)
+        A[:3, :3] = 1 - numpy.eye(3, dtype=numpy.int8)
+        iterate_subgraphs(A, v=0)
+
+
+def _iterate_subgraphs_parallel(
+    bitmat: bool,
+    state: tuple,
+    k: int,
+    required: Any,
+    max_workers: int | None,
+) -> list[tuple]:
+    """This function iterates through the subgraphs
+    from a single state of the stack of subgraphs,
+    splitting the iteration over parallel processes.
+    The stack is first grown serially until it holds
+    a few states per process; every state on the stack
+    then heads an independent branch of subgraphs,
+    which are iterated through in parallel. The results
+    are merged in the order of the serial iteration, and
+    need no deduplication.
+
+    Args:
+        bitmat (bool): Whether the state is of the
+            bitmatrix (True) or CSR (False) iteration.
+        state (tuple): The state to start from.
+        k (int): 1 + maximum number of nonzero elements
+            of the adjacency matrix allowed in a subgraph.
+        required (Any): The required vertices, in the
+            representation used by the iteration.
+        max_workers (int | None): Maximum number of
+            parallel processes to start at a time.
+            If None, uses the number of available
+            CPUs on the system.
+
+    Returns:
+        list[tuple]: The valid subgraphs, as returned
+            by the iteration.
+    """
+    kernel = _iterate_subgraphs_bitmat_nb if bitmat else _iterate_subgraphs_nb
+    stack = List()
+    stack.append(state)
+    if max_workers == 1:
+        return list(kernel(stack, k, required, 0)[0])
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    subgraphs, stack = kernel(stack, k, required, 4 * max_workers)
+    subgraphs = list(subgraphs)
+    if len(stack) == 0:
+        return subgraphs
+    # The stack is popped from the top, so the branches are
+    # taken in reverse to keep the order of the serial iteration:
+    args = [(bitmat, state, k, required) for state in reversed(stack)]
+    # Use multiprocessing.Pool to parallelize:
+    with Pool(processes=max_workers) as pool:
+        for branch in pool.imap(_iterate_subgraphs_branch, args):
+            subgraphs.extend(branch)
+    return subgraphs
+
+
+def _iterate_subgraphs_branch(args: tuple) -> list[tuple]:
+    """This function iterates through the subgraphs
+    in a single branch. It is a wrapper function for
+    multiprocessing.
+
+    Args:
+        args (tuple): Tuple of (bitmat, state, k, required),
+            as passed to _iterate_subgraphs_parallel.
+
+    Returns:
+        list[tuple]: The valid subgraphs in the branch.
+    """
+    bitmat, state, k, required = args
+    kernel = _iterate_subgraphs_bitmat_nb if bitmat else _iterate_subgraphs_nb
+    stack = List()
+    stack.append(state)
+    return list(kernel(stack, k, required, 0)[0])
+
+
+@njit(cache=True)
+def _iterate_subgraphs_nb(  # pylint: disable=too-many-locals,while-used
+    stack: List,
+    k: int,
+    required: numpy.ndarray,
+    max_states: int,
+) -> tuple[List, List]:
+    """This function iterates through the subgraphs
+    of a graph in CSR representation which already
+    satisfies the sink/source condition, using an
+    explicit stack of subgraphs instead of recursion.
+    Each state on the stack is a tuple of the CSR index
+    pointer array, column indices array, verts bitset
+    (of uint64 words), in-degrees, out-degrees, and pos.
+    For each subgraph on the stack, the edges before
+    pos have already been decided to be kept, so only
+    subgraphs containing all of them are iterated
+    through from it. Every subgraph either keeps the
+    edge at pos or does not, so each valid subgraph
+    is found exactly once.
+
+    Args:
+        stack (List): The (non-empty) stack of states
+            to iterate through the subgraphs of.
+        k (int): 1 + maximum number of nonzero elements
+            of the adjacency matrix allowed in a subgraph.
+        required (numpy.ndarray): The vertices which
+            must be included in valid subgraphs.
+        max_states (int): If positive, the iteration
+            stops once the stack holds this many states.
+
+    Returns:
+        (List, List): list of tuples of the CSR index
+            pointer array, column indices array, and
+            verts bitset of each valid subgraph, and the
+            remaining stack.
+    """
+    subgraph_list = List()
+    # Append and remove an element, so that numba can
+    # infer the type of the elements of the list:
+    subgraph_list.append((stack[0][0], stack[0][1], stack[0][2]))
+    subgraph_list.pop()
+    while len(stack) > 0 and (max_states <= 0 or len(stack) < max_states):
+        indptr, indices, verts, in_d, out_d, pos = stack.pop()
+        # Every subgraph from here on has at least pos edges:
+        if pos >= k:
+            continue
+        if pos == len(indices):
+            if len(indices) > 0:
+                subgraph_list.append((indptr, indices, verts))
+            continue
+        # Subgraphs which do not keep the edge at pos (pushed
+        # first, so they are iterated through after the subgraphs
+        # which keep it). If I just reduce each individual edge
+        # to 0, I may miss subgraphs in the case when there are
+        # multiple edges going from one vertex to another, i.e.,
+        # when the value of the element in the adjacency matrix
+        # is >1.
+        this_indptr, this_indices = _csr_remove_edge_nb(indptr, indices, pos)
+        this_in_d, this_out_d = in_d.copy(), out_d.copy()
+        this_in_d[numpy.searchsorted(indptr, pos, side="right") - 1] -= 1
+        this_out_d[indices[pos]] -= 1
+        this_indptr, this_indices, this_verts = _csr_validate_sink_source_nb(
+            this_indptr, this_indices, verts, this_in_d, this_out_d, required
+        )
+        if len(this_indices) > 0 and _kept_edges_active_nb(
+            indptr, indices, this_verts, pos
+        ):
+            stack.append(
+                (
+                    this_indptr,
+                    this_indices,
+                    this_verts,
+                    this_in_d,
+                    this_out_d,
+                    pos,
+                )
+            )
+        # Subgraphs which keep the edge at pos:
+        stack.append((indptr, indices, verts, in_d, out_d, pos + 1))
+    return subgraph_list, stack
+
+
+@njit(cache=True)
+def _iterate_subgraphs_bitmat_nb(  # pylint: disable=too-many-locals,while-used
+    stack: List,
+    k: int,
+    required: numpy.uint64,
+    max_states: int,
+) -> tuple[List, List]:
+    """This function performs the same iteration as
+    _iterate_subgraphs_nb, for a graph with at most
+    64 vertices represented as a bitmatrix. Each state
+    on the stack is a tuple of the rows of the bitmatrix
+    (as an array of uint64 words), the verts bitset, the
+    position start of the next undecided edge, the
+    number of edges kept, and the number of edges. The edges are decided in the
+    order of their positions i * 64 + j in the bitmatrix.
+
+    Args:
+        stack (List): The (non-empty) stack of states
+            to iterate through the subgraphs of.
+        k (int): 1 + maximum number of nonzero elements
+            of the adjacency matrix allowed in a subgraph.
+        required (numpy.uint64): A bitset of the vertices
+            which must be included in valid subgraphs.
+        max_states (int): If positive, the iteration
+            stops once the stack holds this many states.
+
+    Returns:
+        (List, List): list of tuples of the bitmatrix
+            rows and verts bitset of each valid subgraph,
+            and the remaining stack.
+    """
+    one = numpy.uint64(1)
+    dim = len(stack[0][0])
+    subgraph_list = List()
+    # Append and remove an element, so that numba can
+    # infer the type of the elements of the list:
+    subgraph_list.append((stack[0][0], stack[0][1]))
+    subgraph_list.pop()
+    while len(stack) > 0 and (max_states <= 0 or len(stack) < max_states):
+        rows, verts, start, kept, n_edges = stack.pop()
+        # Every subgraph from here on has at least kept edges:
+        if kept >= k:
+            continue
+        # Find the first undecided edge, at or after start:
+        i = start >> 6
+        remaining = numpy.uint64(0)
+        if i < dim:
+            remaining = rows[i] & ~((one << numpy.uint64(start & 63)) - one)
+            while remaining == 0 and i + 1 < dim:
+                i += 1
+                remaining = rows[i]
+        if remaining == 0:
+            if n_edges > 0:
+                subgraph_list.append((rows, verts))
+            continue
+        # Index of the lowest set bit:
+        j = popcount((remaining & (~remaining + one)) - one)
+        # Subgraphs which do not keep the edge (i, j):
+        this_rows = rows.copy()
+        this_rows[i] &= ~(one << j)
+        this_verts, this_n_edges = _bitmat_validate_sink_source_nb(
+            this_rows, verts, n_edges - 1
+        )
+        # Removing the edge may have made a vertex of an already
+        # kept edge a sink or a source, in which case that edge
+        # was removed as well, and these subgraphs are invalid:
+        kept_before = (one << j) - one
+        if (
+            this_n_edges > 0
+            and this_verts & required == required
+            and numpy.array_equal(this_rows[:i], rows[:i])
+            and (this_rows[i] ^ rows[i]) & kept_before == 0
+        ):
+            stack.append(
+                (this_rows, this_verts, i * 64 + int(j), kept, this_n_edges)
+            )
+        # Subgraphs which keep the edge (i, j):
+        stack.append((rows, verts, i * 64 + int(j) + 1, kept + 1, n_edges))
+    return subgraph_list, stack
+
+
+# numba cannot type the assignment expression which pylint suggests:
+@njit(cache=True)
+def _bitmat_validate_sink_source_nb(  # pylint: disable=while-used,consider-using-assignment-expr
+    rows: numpy.ndarray,
+    verts: numpy.uint64,
+    n_edges: int,
+) -> tuple[numpy.uint64, int]:
+    """This function performs the same validation as
+    validate_graph_sink_source_condition, in place,
+    for a graph with at most 64 vertices represented
+    as a bitmatrix whose inactive vertices have no
+    edges.
+
+    Args:
+        rows (numpy.ndarray): The rows of the bitmatrix
+            of the graph, as an array of uint64 words.
+        verts (numpy.uint64): A bitset representing the
+            active vertices in the graph.
+        n_edges (int): The number of edges in the graph.
+
+    Returns:
+        (numpy.uint64, int): The validated verts bitset,
+            and the number of edges left. The edges are
+            only counted again if any were removed.
+    """
+    one = numpy.uint64(1)
+    changed = False
+    while True:
+        in_mask = numpy.uint64(0)
+        out_mask = numpy.uint64(0)
+        for i, row in enumerate(rows):
+            if row != 0:
+                in_mask |= one << numpy.uint64(i)
+                out_mask |= row
+        new_verts = verts & in_mask & out_mask
+        if new_verts == verts:
+            break
+        changed = True
+        verts = new_verts
+        for i, row in enumerate(rows):
+            if (verts >> numpy.uint64(i)) & one:
+                rows[i] = row & verts
+            else:
+                rows[i] = 0
+    if changed:
+        n_edges = 0
+        for row in rows:
+            n_edges += int(popcount(row))
+    return verts, n_edges
+
+
+@njit(cache=True)
+def _kept_edges_active_nb(
+    indptr: numpy.ndarray,
+    indices: numpy.ndarray,
+    verts: numpy.ndarray,
+    pos: int,
+) -> bool:
+    """This function checks whether both vertices of
+    each of the edges which have been decided to be
+    kept are still active. Removing an edge may make
+    a vertex of a kept edge a sink or a source, in
+    which case that edge is removed as well.
+
+    Args:
+        indptr (numpy.ndarray): The CSR index pointer
+            array of the graph before the edge removal.
+        indices (numpy.ndarray): The CSR column indices
+            array of the graph before the edge removal.
+        verts (numpy.ndarray): A bitset (of uint64 words)
+            representing the active vertices after the
+            edge removal.
+        pos (int): The number of edges which have been
+            decided to be kept.
+
+    Returns:
+        bool: Whether all the kept edges are still
+            active (True), or not (False).
+    """
+    for i in range(len(indptr) - 1):
+        for e in range(indptr[i], min(indptr[i + 1], pos)):
+            if not (bit_is_set(verts, i) and bit_is_set(verts, indices[e])):
+                return False
+    return True
+
+
+@njit(cache=True)
+def _csr_remove_edge_nb(
+    indptr: numpy.ndarray,
+    indices: numpy.ndarray,
+    pos: int,
+) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """This function removes a single edge from a
+    graph in CSR representation.
+
+    Args:
+        indptr (numpy.ndarray): The CSR index pointer
+            array of the graph.
+        indices (numpy.ndarray): The CSR column indices
+            array of the graph.
+        pos (int): The position in indices of the
+            edge to remove.
+
+    Returns:
+        (numpy.ndarray, numpy.ndarray): The CSR index
+            pointer and column indices arrays of the
+            graph without the edge.
+    """
+    new_indptr = indptr.copy()
+    for i, ptr in enumerate(indptr):
+        if ptr > pos:
+            new_indptr[i] -= 1
+    new_indices = numpy.empty(len(indices) - 1, dtype=indices.dtype)
+    new_indices[:pos] = indices[:pos]
+    new_indices[pos:] = indices[pos + 1 :]
+    return (new_indptr, new_indices)
+
+
+@njit(cache=True)
+def _csr_validate_sink_source_nb(  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-branches,too-many-locals,too-complex,while-used
+    indptr: numpy.ndarray,
+    indices: numpy.ndarray,
+    verts: numpy.ndarray,
+    in_d: numpy.ndarray,
+    out_d: numpy.ndarray,
+    required: numpy.ndarray,
+) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """This function performs the same validation as
+    validate_graph_sink_source_condition, for a graph
+    in CSR representation whose inactive vertices
+    have no edges. The degrees are updated in place
+    as edges are removed, instead of being recalculated,
+    and only the vertices whose degree drops to zero
+    are revisited (through a worklist), so the graph
+    is scanned once rather than once per pass.
+
+    Args:
+        indptr (numpy.ndarray): The CSR index pointer
+            array of the graph.
+        indices (numpy.ndarray): The CSR column indices
+            array of the graph.
+        verts (numpy.ndarray): A bitset (of uint64 words)
+            representing the active vertices in the graph.
+        in_d (numpy.ndarray): The in-degrees of the graph.
+        out_d (numpy.ndarray): The out-degrees of the graph.
+        required (numpy.ndarray): The vertices which
+            must be included in valid subgraphs.
+
+    Returns:
+        (numpy.ndarray, numpy.ndarray, numpy.ndarray): The
+            validated CSR index pointer array, column
+            indices array, and verts bitset.
+    """
+    dim = len(indptr) - 1
+    one = numpy.uint64(1)
+    verts = verts.copy()
+    # Worklist of the active vertices which are sinks or sources.
+    # Each vertex is deactivated as it is pushed, so it is pushed
+    # at most once:
+    worklist = numpy.empty(dim, dtype=numpy.int64)
+    n_work = 0
+    for i in range(dim):
+        if bit_is_set(verts, i) and (in_d[i] == 0 or out_d[i] == 0):
+            verts[i >> 6] &= ~(one << numpy.uint64(i & 63))
+            worklist[n_work] = i
+            n_work += 1
+    if n_work == 0:
+        return (indptr, indices, verts)
+    # The out-edges of each vertex (the elements of its column
+    # of the adjacency matrix), as CSC arrays:
+    out_indptr = numpy.zeros_like(indptr)
+    for j in indices:
+        out_indptr[j + 1] += 1
+    out_indptr = numpy.cumsum(out_indptr)
+    out_indices = numpy.empty_like(indices)
+    fill = out_indptr[:-1].copy()
+    for i in range(dim):
+        for e in range(indptr[i], indptr[i + 1]):
+            out_indices[fill[indices[e]]] = i
+            fill[indices[e]] += 1
+    is_required = numpy.zeros(dim, dtype=numpy.bool_)
+    for vert in required:
+        is_required[vert] = True
+    while n_work > 0:
+        n_work -= 1
+        i = worklist[n_work]
+        # Check that necessary vertices are still included in the subgraph:
+        if is_required[i]:
+            return (
+                numpy.zeros_like(indptr),
+                indices[:0].copy(),
+                numpy.zeros_like(verts),
+            )
+        # Only the neighbours of i lose a degree, and only those
+        # whose degree drops to zero become sinks or sources:
+        for e in range(indptr[i], indptr[i + 1]):
+            j = indices[e]
+            if bit_is_set(verts, j):
+                out_d[j] -= 1
+                if out_d[j] == 0:
+                    verts[j >> 6] &= ~(one << numpy.uint64(j & 63))
+                    worklist[n_work] = j
+                    n_work += 1
+        for e in range(out_indptr[i], out_indptr[i + 1]):
+            j = out_indices[e]
+            if bit_is_set(verts, j):
+                in_d[j] -= 1
+                if in_d[j] == 0:
+                    verts[j >> 6] &= ~(one << numpy.uint64(j & 63))
+                    worklist[n_work] = j
+                    n_work += 1
+    # Rebuild the CSR arrays once, without the inactive vertices:
+    new_indptr = numpy.zeros_like(indptr)
+    new_indices = numpy.empty_like(indices)
+    count = 0
+    for i in range(dim):
+        if bit_is_set(verts, i):
+            for e in range(indptr[i], indptr[i + 1]):
+                if bit_is_set(verts, indices[e]):
+                    new_indices[count] = indices[e]
+                    count += 1
+        else:
+            in_d[i] = 0
+            out_d[i] = 0
+        new_indptr[i + 1] = count
+    return (new_indptr, new_indices[:count], verts)
+
+
+def _csr_drop_vertices(
+    indptr: numpy.ndarray,
+    indices: numpy.ndarray,
+    inds: numpy.ndarray,
+) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """This function removes the edges into and out of
+    some vertices of a graph in CSR representation, the
+    CSR equivalent of zero_rows_and_cols.
+
+    Args:
+        indptr (numpy.ndarray): The CSR index pointer
+            array of the graph.
+        indices (numpy.ndarray): The CSR column indices
+            array of the graph.
+        inds (numpy.ndarray): The vertices whose edges
+            should be removed.
+
+    Returns:
+        (numpy.ndarray, numpy.ndarray): The CSR index
+            pointer and column indices arrays of the
+            graph without the removed edges.
+    """
+    dim = len(indptr) - 1
+    rows = numpy.repeat(numpy.arange(dim), numpy.diff(indptr))
+    keep = ~(numpy.isin(indices, inds) | numpy.isin(rows, inds))
+    new_indptr = numpy.zeros_like(indptr)
+    numpy.cumsum(numpy.bincount(rows[keep], minlength=dim), out=new_indptr[1:])
+    return (new_indptr, indices[keep])
+
+
+def _csr_prune_graph(
+    A: numpy.ndarray | scipy.sparse.csr_array,
+    indptr: numpy.ndarray,
+    indices: numpy.ndarray,
     verts: numpy.ndarray,
 ) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """This function performs the same pruning as
+    prune_graph, for a subgraph in CSR representation.
+
+    Args:
+        A (numpy.ndarray | scipy.sparse.csr_array): The
+            adjacency matrix of the original graph, used
+            to recover the values of the edges in the
+            subgraph.
+        indptr (numpy.ndarray): The CSR index pointer
+            array of the subgraph.
+        indices (numpy.ndarray): The CSR column indices
+            array of the subgraph.
+        verts (numpy.ndarray): A vector representing
+            the active vertices in the subgraph.
+
+    Returns:
+        (numpy.ndarray, numpy.ndarray): The pruned
+            adjacency matrix and the vertex labels.
+    """
+    if scipy.sparse.issparse(A):
+        return _prune_graph_arr(csr_subgraph(A, indptr, indices), verts)
+    rows = numpy.repeat(numpy.arange(len(indptr) - 1), numpy.diff(indptr))
+    this_A = numpy.zeros_like(A)
+    this_A[rows, indices] = A[rows, indices]
+    return _prune_graph_arr(this_A, verts)
+
+
+def prune_graph(
+    A: (
+        numpy.ndarray
+        | networkx.Graph
+        | scipy.sparse.sparray
+        | scipy.sparse.spmatrix
+    ),
+    verts: numpy.ndarray,
+) -> tuple[
+    numpy.ndarray | scipy.sparse.sparray | scipy.sparse.spmatrix,
+    numpy.ndarray,
+]:
     """This function prunes disconnected vertices
     from the adjacency matrix of a graph.
 
     Args:
-        A (networkx.Graph | numpy.ndarray): The graph,
-            represented as a networkx.Graph or
-            a numpy adjacency matrix.
+        A (networkx.Graph | numpy.ndarray |
+            scipy.sparse.sparray | scipy.sparse.spmatrix):
+            The graph, represented as a networkx.Graph,
+            or a numpy or scipy sparse adjacency matrix.
         verts (numpy.ndarray): A vector representing
             the active vertices in the graph.
 
     Returns:
-        (numpy.ndarray, numpy.ndarray): The pruned
-            adjacency matrix and the vertex labels.
+        (numpy.ndarray | scipy.sparse.sparray |
+            scipy.sparse.spmatrix, numpy.ndarray): The
+            pruned adjacency matrix, in the format of
+            A, and the vertex labels.
             Note that the vertext labels are not the
-            same shape as verts (n by 1), rather (1 by m),
-            where m <= n is the number of active vertices.
+            same shape as verts (n), rather (m), where
+            m <= n is the number of active vertices.
+    """
+    return _prune_graph_arr(*_dimen_type_val_nocopy(A, verts))
+
+
+def _prune_graph_arr(
+    A: numpy.ndarray | scipy.sparse.sparray | scipy.sparse.spmatrix,
+    verts: numpy.ndarray,
+) -> tuple[
+    numpy.ndarray | scipy.sparse.sparray | scipy.sparse.spmatrix,
+    numpy.ndarray,
+]:
+    """This function performs the same pruning as
+    prune_graph, for an already validated adjacency
+    matrix and verts vector, without any type checks
+    or conversions.
+
+    Args:
+        A (numpy.ndarray | scipy.sparse.sparray |
+            scipy.sparse.spmatrix): The adjacency matrix.
+        verts (numpy.ndarray): A vector representing
+            the active vertices in the graph.
+
+    Returns:
+        (numpy.ndarray | scipy.sparse.sparray |
+            scipy.sparse.spmatrix, numpy.ndarray): The
+            pruned adjacency matrix and the vertex labels.
     """
-    A, verts = dimen_type_val(A, verts)
     active_verts = numpy.nonzero(verts)[0]
-    active_eye = numpy.zeros((A.shape[0], len(active_verts)))
-    for ind, vert in enumerate(active_verts):
-        active_eye[vert, ind] = 1
-    pruned_A = numpy.matmul(active_eye.T, A)
-    pruned_A = numpy.matmul(pruned_A, active_eye)
-    return (pruned_A, active_verts)
+    if scipy.sparse.issparse(A):
+        return (prune_sparse(A, verts != 0), active_verts)
+    # Advanced indexing already returns a copy:
+    return (A[numpy.ix_(active_verts, active_verts)], active_verts)
 
 
 def validate_graph_sink_source_condition(
-    A: numpy.ndarray | networkx.Graph,
+    A: (
+        numpy.ndarray
+        | networkx.Graph
+        | scipy.sparse.sparray
+        | scipy.sparse.spmatrix
+    ),
     verts: numpy.ndarray | None = None,
     v: int | list[int] | None = None,
-) -> tuple[numpy.ndarray, numpy.ndarray]:
+) -> tuple[
+    numpy.ndarray | scipy.sparse.sparray | scipy.sparse.spmatrix,
+    numpy.ndarray,
+]:
     """This function validates that a graph
     (represented by its adjacency matrix) does
     not have any vertices which are sinks or
@@ -124,11 +835,15 @@ def validate_graph_sink_source_condition(
     and setting the active status in the verts
     vector to zero. This function also creates
     the verts vector if it is not passed in.
+    The vertices are peeled off with the in and
+    out degrees of a CSR representation, which is
+    read directly from a sparse adjacency matrix.
 
     Args:
-        A (networkx.Graph | numpy.ndarray): The graph,
-            represented as a networkx.Graph or
-            a numpy adjacency matrix.
+        A (networkx.Graph | numpy.ndarray |
+            scipy.sparse.sparray | scipy.sparse.spmatrix):
+            The graph, represented as a networkx.Graph,
+            or a numpy or scipy sparse adjacency matrix.
         verts (numpy.ndarray | None): A vector
             representing the active vertices in the
             graph. If None, a vector of ones will
@@ -143,22 +858,66 @@ def validate_graph_sink_source_condition(
             valid. Defaults to None.
 
     Returns:
-        (numpy.ndarray, numpy.ndarray): The validated
-            adjacency matrix and verts vector.
+        (numpy.ndarray | scipy.sparse.sparray |
+            scipy.sparse.spmatrix, numpy.ndarray): The
+            validated adjacency matrix, in CSR format
+            if A is sparse, and verts vector.
     """
-    A, verts = dimen_type_val(A, verts)
-    # print(f"Before: {A, verts}")
-    verts = numpy.logical_and(verts, in_deg(A)).astype(int)
-    verts = numpy.logical_and(verts, out_deg(A)).astype(int)
-    A_new = zero_rows_and_cols(A.copy(), verts)
-    # print(f"After: {A, verts}")
+    # This is the only copy of A; it is modified in place below:
+    return _validate_sink_source_arr(*dimen_type_val(A, verts), v)
+
+
+def _validate_sink_source_arr(
+    A: numpy.ndarray | scipy.sparse.sparray | scipy.sparse.spmatrix,
+    verts: numpy.ndarray,
+    v: int | list[int] | None = None,
+) -> tuple[
+    numpy.ndarray | scipy.sparse.sparray | scipy.sparse.spmatrix,
+    numpy.ndarray,
+]:
+    """This function performs the same validation as
+    validate_graph_sink_source_condition, in place, for
+    an already validated adjacency matrix and verts
+    vector, without any type checks or conversions.
+
+    Args:
+        A (numpy.ndarray | scipy.sparse.sparray |
+            scipy.sparse.spmatrix): The adjacency matrix,
+            which is modified in place.
+        verts (numpy.ndarray): A vector representing
+            the active vertices in the graph.
+        v (in | list[int] | None): Vertices which
+            must be included in subgraphs for the
+            subgraphs to be considered valid. Defaults
+            to None.
+
+    Returns:
+        (numpy.ndarray | scipy.sparse.sparray |
+            scipy.sparse.spmatrix, numpy.ndarray): The
+            validated adjacency matrix and verts vector.
+    """
+    dim = A.shape[0]
+    # The sinks and sources are peeled off the CSR representation,
+    # and A is zeroed once at the end:
+    indptr, indices = _csr_drop_vertices(
+        *mat_to_csr(A), numpy.nonzero(verts == 0)[0]
+    )
+    _, _, bits = _csr_validate_sink_source_nb(
+        indptr,
+        indices,
+        verts_to_bits(verts),
+        csr_in_deg(indptr),
+        csr_out_deg(indices, dim),
+        numpy.array([], dtype=numpy.int64),
+    )
+    verts = bits_to_verts(bits, dim)
     # Check that necessary vertices are still included in the subgraph:
     if not validate_vertices(verts, v):
-        dim = A.shape[0]
-        return (numpy.zeros((dim, dim)), numpy.zeros((dim, 1)))
-    if numpy.array_equal(A_new, A):
-        return (A_new, verts)
-    return validate_graph_sink_source_condition(A_new, verts, v)
+        verts = numpy.zeros(dim, dtype=numpy.uint8)
+        if not scipy.sparse.issparse(A):
+            return (numpy.zeros((dim, dim)), verts)
+    # A sparse matrix in another format than CSR is converted to CSR:
+    return (zero_rows_and_cols(A, verts, in_place=True), verts)
 
 
 def validate_vertices(
@@ -187,26 +946,35 @@ def validate_vertices(
     """
     if v is None:
         return True
-    if isinstance(v, int):
-        v = [v]
-    if any(active_verts[vert] == 0 for vert in v):
-        return False
-    return True
+    # A single gather of the required vertices, for any shape of active_verts:
+    return bool(
+        numpy.ravel(active_verts)[numpy.asarray(v, dtype=numpy.intp)].all()
+    )
 
 
 def zero_rows_and_cols(
-    mat: numpy.ndarray,
+    mat: numpy.ndarray | scipy.sparse.sparray | scipy.sparse.spmatrix,
     vec: numpy.ndarray,
     in_place: bool = False,
-) -> numpy.ndarray:
+) -> numpy.ndarray | scipy.sparse.sparray | scipy.sparse.spmatrix:
     """This function clears rows and columns
     in a matrix corresponding to the index
-    where values in a vector are 0.
+    where values in a vector are 0. A dense
+    matrix is zeroed outside the outer product of
+    the nonzero mask of the vector with itself, in
+    a single pass (also where it is infinite or
+    NaN), and is unchanged inside it. A sparse
+    matrix has the stored values in those rows
+    and columns removed.
 
     Args:
-        mat (numpy.ndarray): The n by n matrix
+        mat (numpy.ndarray | scipy.sparse.sparray |
+            scipy.sparse.spmatrix): The n by n matrix
             whose rows and columns should be zeroed.
-        vec (numpy.ndarray): The n by 1 vector whose
+            Sparse matrices in a format other than
+            CSR are converted to CSR, so they cannot
+            be changed in place.
+        vec (numpy.ndarray): The length n vector whose
             values correspond to rows and columns in
             the matrix.
         in_place (bool): Whether to operate on the
@@ -214,13 +982,18 @@ def zero_rows_and_cols(
             Defaults to False.
 
     Returns:
-        numpy.ndarray: The matrix with the
+        numpy.ndarray | scipy.sparse.sparray |
+            scipy.sparse.spmatrix: The matrix with the
             zeroed rows and columns corresponding
             to the zero values in the vector.
     """
-    if not in_place:
-        mat = mat.copy()
-    inds = numpy.where(vec == 0)[0]
-    mat[inds, :] = 0
-    mat[:, inds] = 0
-    return mat
+    keep = numpy.ravel(vec) != 0
+    if scipy.sparse.issparse(mat):
+        return zero_rows_and_cols_sparse(mat, keep, in_place)
+    mask = numpy.logical_and.outer(keep, keep)
+    if in_place:
+        numpy.copyto(mat, 0, where=~mask)
+        return mat
+    zeroed_mat = numpy.zeros_like(mat)
+    numpy.copyto(zeroed_mat, mat, where=mask)
+    return zeroed_mat
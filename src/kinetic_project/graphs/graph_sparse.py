@@ -0,0 +1,99 @@
+"""This file contains the operations of graph_ops
+on scipy sparse adjacency matrices, which only
+touch the stored values of the matrices."""
+
+import numpy
+import scipy.sparse
+
+
+def csr_subgraph(
+    A: scipy.sparse.csr_array,
+    indptr: numpy.ndarray,
+    indices: numpy.ndarray,
+) -> scipy.sparse.csr_array:
+    """This function builds the sparse adjacency matrix
+    of a subgraph in CSR representation, with the values
+    of its edges in the adjacency matrix of the graph.
+
+    Args:
+        A (scipy.sparse.csr_array): The adjacency matrix
+            of the graph.
+        indptr (numpy.ndarray): The CSR index pointer
+            array of the subgraph.
+        indices (numpy.ndarray): The CSR column indices
+            array of the subgraph.
+
+    Returns:
+        scipy.sparse.csr_array: The adjacency matrix
+            of the subgraph.
+    """
+    rows = numpy.repeat(numpy.arange(len(indptr) - 1), numpy.diff(indptr))
+    return scipy.sparse.csr_array(
+        (numpy.ravel(A[rows, indices]), indices, indptr), shape=A.shape
+    )
+
+
+def prune_sparse(
+    A: scipy.sparse.sparray | scipy.sparse.spmatrix,
+    keep: numpy.ndarray,
+) -> scipy.sparse.sparray | scipy.sparse.spmatrix:
+    """This function prunes a sparse adjacency matrix,
+    for graph_ops.prune_graph, by masking the rows and
+    columns of its stored values in COO format in a
+    single pass, and relabeling the kept vertices.
+
+    Args:
+        A (scipy.sparse.sparray | scipy.sparse.spmatrix):
+            The adjacency matrix.
+        keep (numpy.ndarray): The boolean mask of the
+            active vertices.
+
+    Returns:
+        scipy.sparse.sparray | scipy.sparse.spmatrix: The
+            pruned adjacency matrix, in the format of A.
+    """
+    coo = A.tocoo()
+    kept = keep[coo.row] & keep[coo.col]
+    # The new label of each active vertex:
+    labels = numpy.cumsum(keep) - 1
+    dim = int(numpy.count_nonzero(keep))
+    pruned = type(coo)(
+        (coo.data[kept], (labels[coo.row[kept]], labels[coo.col[kept]])),
+        shape=(dim, dim),
+    )
+    return pruned.asformat(A.format)
+
+
+def zero_rows_and_cols_sparse(
+    mat: scipy.sparse.sparray | scipy.sparse.spmatrix,
+    keep: numpy.ndarray,
+    in_place: bool = False,
+) -> scipy.sparse.sparray | scipy.sparse.spmatrix:
+    """This function clears rows and columns in a
+    sparse matrix, for graph_ops.zero_rows_and_cols,
+    by removing the stored values in them from its
+    CSR arrays.
+
+    Args:
+        mat (scipy.sparse.sparray | scipy.sparse.spmatrix):
+            The n by n matrix whose rows and columns should
+            be zeroed.
+        keep (numpy.ndarray): The length n boolean mask of
+            the rows and columns to keep.
+        in_place (bool): Whether to operate on the
+            original matrix (True), or a copy (False).
+            Defaults to False.
+
+    Returns:
+        scipy.sparse.sparray | scipy.sparse.spmatrix: The
+            matrix, in CSR format, without the stored values
+            in the rows and columns which are not kept.
+    """
+    if not isinstance(mat, (scipy.sparse.csr_array, scipy.sparse.csr_matrix)):
+        mat = mat.tocsr()
+    elif not in_place:
+        mat = mat.copy()
+    rows = numpy.repeat(numpy.arange(mat.shape[0]), numpy.diff(mat.indptr))
+    mat.data[~(keep[rows] & keep[mat.indices])] = 0
+    mat.eliminate_zeros()
+    return mat
@@ -0,0 +1,124 @@
+"""This file contains the numba objects used to
+compile functions, with plain python fallbacks
+for when numba is not installed."""
+
+from collections.abc import Callable
+from typing import Any
+
+try:  # pylint: disable=too-many-try-statements
+    from numba import get_num_threads, njit, prange, threading_layer, typeof
+    from numba.core.dispatcher import Dispatcher
+    from numba.core.errors import NumbaError
+    from numba.typed import List
+except ImportError:  # pragma: no cover
+    Dispatcher = None  # type: ignore[misc,assignment]
+    NumbaError = Exception  # type: ignore[misc,assignment]
+    List = list
+    prange = range  # type: ignore[misc]  # pylint: disable=invalid-name
+
+    def get_num_threads() -> int:
+        """Stand-in for numba.get_num_threads, as code
+        runs on a single thread without numba.
+
+        Returns:
+            int: 1.
+        """
+        return 1
+
+    def njit(*args: Any, **kwargs: Any) -> Callable:  # type: ignore[no-redef]
+        """Stand-in for numba.njit which returns the
+        function uncompiled.
+
+        Args:
+            *args (Any): The function to compile, when
+                used as a bare decorator.
+            **kwargs (Any): Compilation options, which
+                are ignored.
+
+        Returns:
+            Callable: The function, or a decorator
+                returning the function.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    def threading_layer() -> str:  # type: ignore[misc]
+        """Stand-in for numba.threading_layer, as no
+        threading layer is ever launched without numba.
+
+        Raises:
+            ValueError: Always.
+        """
+        raise ValueError("numba is not installed.")
+
+
+def is_jitted(func: Any) -> bool:
+    """Checks whether a function was compiled with
+    numba, and so can be called from other compiled
+    functions.
+
+    Args:
+        func (Any): The function to check.
+
+    Returns:
+        bool: Whether func is a numba dispatcher (True),
+            or not (False). Always False when numba is
+            not installed.
+    """
+    return Dispatcher is not None and isinstance(func, Dispatcher)
+
+
+def try_njit(func: Callable, *args: Any) -> Callable | None:
+    """Compiles a function with numba for the types of
+    the given example arguments, without calling it.
+
+    Args:
+        func (Callable): The function to compile.
+        *args (Any): Example arguments, whose types the
+            function is compiled for.
+
+    Returns:
+        Callable | None: The compiled function, or None if
+            numba is not installed or cannot compile func.
+    """
+    if Dispatcher is None:
+        return None
+    try:  # pylint: disable=too-many-try-statements
+        compiled = njit(func)
+        compiled.compile(tuple(typeof(arg) for arg in args))
+    except (NumbaError, TypeError):
+        return None
+    return compiled
+
+
+# The threading layer of numba which cannot be forked:
+_FORK_UNSAFE_LAYER = "tbb"
+
+
+def fork_safe() -> bool:
+    """Checks whether the process can be forked safely
+    after running numba's parallel regions: the TBB
+    threading layer of numba hangs the forking process
+    at exit once it has been launched.
+
+    Returns:
+        bool: Whether no parallel region ran with the
+            TBB threading layer (True), or one did (False).
+    """
+    try:
+        return threading_layer() != _FORK_UNSAFE_LAYER
+    except ValueError:
+        return True
+
+
+__all__ = [
+    "List",
+    "NumbaError",
+    "fork_safe",
+    "get_num_threads",
+    "is_jitted",
+    "njit",
+    "prange",
+    "try_njit",
+]
@@ -2,12 +2,59 @@
 Subgradient Descent method using the Augmented
 Lagrangian."""
 
+import inspect
+import os
 from collections.abc import Callable
-from multiprocessing import Pool
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from enum import StrEnum
+from multiprocessing import get_context
 from typing import Any
 
 import numpy
 
+from kinetic_project.jit import fork_safe, get_num_threads, is_jitted
+from kinetic_project.optimizations.subgradient_methods_evaluators import (
+    MAX_GENERATED_FUNCS,
+    coordinate_evaluator,
+)
+from kinetic_project.optimizations.subgradient_methods_lbfgs import (
+    augmented_lagrangian_lbfgs,
+)
+from kinetic_project.optimizations.subgradient_methods_numba import (
+    compile_coordinate_functions,
+    compile_vector_function,
+    descent_core,
+    descent_many,
+)
+
+# The functions and keyword arguments shared by all the tasks
+# of a worker process, set once by _init_worker:
+_WORKER_STATE: dict[str, Any] = {}
+
+
+class Backends(StrEnum):
+    """Class enumerating the allowed backends of
+    subgradient_descent."""
+
+    NUMPY = "numpy"
+    JAX = "jax"
+
+
+class InnerSolvers(StrEnum):
+    """Class enumerating the allowed inner solvers of
+    subgradient_descent."""
+
+    SUBGRADIENT = "subgradient"
+    LBFGS = "lbfgs"
+
+
+class ParallelBackends(StrEnum):
+    """Class enumerating the allowed parallel backends
+    of run_multiple_initializations_parallel."""
+
+    MP = "mp"
+    NUMBA = "numba"
+
 
 def objective_function(
     x: numpy.ndarray,
@@ -29,9 +76,95 @@ def objective_function(
     Returns:
         numpy.float64: The objective function.
     """
-    if argmax:
-        return -sum(f(x_i) for x_i, f in zip(x, funcs))
-    return sum(f(x_i) for x_i, f in zip(x, funcs))
+    return _objective_function(
+        x, coordinate_evaluator(tuple(funcs)), -1.0 if argmax else 1.0
+    )
+
+
+def _objective_function(
+    x: numpy.ndarray,
+    evaluate: Callable,
+    sign: float = 1.0,
+) -> float:
+    """Compute the sum of all objective functions,
+    with an evaluator built by coordinate_evaluator.
+
+    Args:
+        x (numpy.ndarray): The vector of coordinates.
+        evaluate (callable): The evaluator of the
+            functions in the objective.
+        sign (float): The multiplier of the objective,
+            -1.0 to maximize the objective and find the
+            argmax, or 1.0 to minimize the objective and
+            find the argmin. Defaults to 1.0.
+
+    Returns:
+        float: The objective function.
+    """
+    return sign * float(numpy.add.reduce(evaluate(x)))
+
+
+def _obj_and_c(
+    x: numpy.ndarray,
+    evaluate: Callable,
+    sign: float = 1.0,
+) -> tuple[float, float]:
+    """Compute the objective function and the constraint
+    violation together, for the callers needing both at
+    the same point.
+
+    Args:
+        x (numpy.ndarray): The vector of coordinates.
+        evaluate (callable): The evaluator of the
+            functions in the objective.
+        sign (float): The multiplier of the objective,
+            -1.0 to maximize the objective and find the
+            argmax, or 1.0 to minimize the objective and
+            find the argmin. Defaults to 1.0.
+
+    Returns:
+        tuple[float, float]: The objective function and
+            the constraint violation c(x).
+    """
+    return (
+        _objective_function(x, evaluate, sign),
+        float(numpy.add.reduce(x)) - 1.0,
+    )
+
+
+def _compiled_objective(
+    funcs: list[Callable], compile_funcs: bool = False
+) -> Callable | None:
+    """Find the compiled function which the compiled loop
+    of subgradient_descent can run with, if there is one.
+
+    Args:
+        funcs (list[callable]): The list of functions
+            in the objective.
+        compile_funcs (bool): Whether to try to compile
+            the functions with numba (True), or to only use
+            already compiled functions (False).
+            Defaults to False.
+
+    Returns:
+        callable | None: The compiled function taking and
+            returning a vector, if all the functions are
+            the same function of a vector, or up to
+            MAX_GENERATED_FUNCS functions of a single
+            coordinate, which are compiled (or compilable
+            when compile_funcs is True), and None otherwise.
+    """
+    if (
+        len({id(f) for f in funcs}) == 1
+        and (compile_funcs or is_jitted(funcs[0]))
+        and (f_vec := compile_vector_function(funcs[0])) is not None
+    ):
+        return f_vec
+    if len(funcs) <= MAX_GENERATED_FUNCS and (
+        compile_funcs or all(is_jitted(f) for f in funcs)
+    ):
+        return compile_coordinate_functions(tuple(funcs))
+    return None
 
 
 def constraint_violation(x: numpy.ndarray) -> float:
@@ -41,9 +174,9 @@ def constraint_violation(x: numpy.ndarray) -> float:
         x (numpy.ndarray): The vector of coordinates.
 
     Returns:
-        numpy.float64: The amount of constraint violation.
+        float: The amount of constraint violation.
     """
-    return sum(x) - 1
+    return float(numpy.add.reduce(x)) - 1.0
 
 
 def augmented_lagrangian(
@@ -70,8 +203,10 @@ def augmented_lagrangian(
     Returns:
         numpy.ndarray: The Augmented Lagrangian.
     """
-    c = constraint_violation(x)
-    return objective_function(x, funcs, argmax) + lambd * c + 0.5 * rho * c**2
+    objective, c = _obj_and_c(
+        x, coordinate_evaluator(tuple(funcs)), -1.0 if argmax else 1.0
+    )
+    return objective + lambd * c + 0.5 * rho * c**2
 
 
 def numerical_subgradient(
@@ -81,7 +216,10 @@ def numerical_subgradient(
     argmax: bool = False,
 ) -> float:
     """Estimate the gradient/subgradient numerically,
-    using a finite difference method.
+    using a central difference method, whose error
+    is O(epsilon**2) for smooth functions. At a kink,
+    as of abs at 0, it gives the mean of the one-sided
+    slopes, which is a subgradient of convex functions.
 
     Args:
         f (callable): The function whose subgradient
@@ -99,19 +237,22 @@ def numerical_subgradient(
     Returns:
         float: The calculated subgradient of f at x.
     """
-    if argmax:
-        return -(f(x + epsilon) - f(x)) / epsilon
-    return (f(x + epsilon) - f(x)) / epsilon
+    sign = -1.0 if argmax else 1.0
+    return (f(x + epsilon) - f(x - epsilon)) * (sign / (2 * epsilon))
 
 
 def compute_subgradient(
     x: numpy.ndarray,
     funcs: list[Callable],
     argmax: bool = False,
+    grad_funcs: list[Callable] | None = None,
 ) -> numpy.ndarray:
-    """Compute the subgradient of all functions at point x.
+    """Compute the subgradient of all functions at point x,
+    using a central difference method, or their
+    (sub)gradients if they are given.
 
-    x (numpy.ndarray): The vector of coordinates.
+    Args:
+        x (numpy.ndarray): The vector of coordinates.
         funcs (list[callable]): The list of functions
             in the objective.
         argmax (bool): Whether to invert the objective
@@ -119,24 +260,59 @@ def compute_subgradient(
             argmax (True), instead of minimizing the
             objective to find the argmin (False).
             Defaults to False.
+        grad_funcs (list[callable] | None): The list of
+            the (sub)gradients of the functions in the
+            objective, in the same order as funcs. If given,
+            they are used instead of a finite difference
+            method. As for funcs, a list of the same function
+            repeated is called once on the whole vector of
+            coordinates. Defaults to None.
+
+    Returns:
+        numpy.ndarray: The subgradient of the
+            objective function.
+    """
+    sign = -1.0 if argmax else 1.0
+    if grad_funcs is not None:
+        return sign * coordinate_evaluator(tuple(grad_funcs))(x)
+    return compute_subgradient_vec(
+        x, coordinate_evaluator(tuple(funcs)), sign=sign
+    )
+
+
+def compute_subgradient_vec(
+    x: numpy.ndarray,
+    f_vec: Callable,
+    epsilon: float = 1e-6,
+    sign: float = 1.0,
+    out: numpy.ndarray | None = None,
+) -> numpy.ndarray:
+    """Estimate the subgradient of all functions at
+    point x numerically, using a central difference
+    method on all coordinates at once.
+
+    Args:
+        x (numpy.ndarray): The vector of coordinates.
+        f_vec (callable): A function taking the vector
+            of coordinates, and returning the vector of
+            the values of each function at its coordinate.
+        epsilon (float): The offset from the point
+            for the finite difference method.
+        sign (float): The multiplier of the objective,
+            -1.0 to maximize the objective and find the
+            argmax, or 1.0 to minimize the objective and
+            find the argmin. Defaults to 1.0.
+        out (numpy.ndarray | None): A buffer of the
+            same shape as x to write the subgradient into.
+            If None, a new array is allocated.
+            Defaults to None.
 
     Returns:
         numpy.ndarray: The subgradient of the
             objective function.
     """
-    subgrads = []
-    for x_i, f in zip(x, funcs):
-        # Replace this with a specific gradient or subgradient computation for f
-        # if f == f_abs:  # Example: Check for non-differentiable |x|
-        #     subgrads.append(subgradient_abs(x_i))
-        # elif f == f_square:  # Example: f(x) = x^2
-        #     subgrads.append(2 * x_i)
-        # else:
-        #     raise ValueError(
-        #         "Gradient/subgradient computation not implemented for this function."
-        #     )
-        subgrads.append(numerical_subgradient(f, x_i, argmax=argmax))
-    return numpy.array(subgrads)
+    out = numpy.subtract(f_vec(x + epsilon), f_vec(x - epsilon), out=out)
+    return numpy.multiply(out, sign / (2 * epsilon), out=out)
 
 
 def subgradient_descent(  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
@@ -149,6 +325,12 @@ def subgradient_descent(  # pylint: disable=too-many-arguments,too-many-position
     beta: float = 1.5,
     gamma: float = 0.9,
     argmax: bool = False,
+    return_history: bool = True,
+    log_every: int = 1,
+    grad_funcs: list[Callable] | None = None,
+    backend: str = "numpy",
+    compile_funcs: bool = False,
+    inner_solver: str = "subgradient",
 ) -> tuple[numpy.ndarray, float, float, list[dict]]:
     """Perform subgradient descent on an Augmented Lagrangian
     with a dynamically updated penalty parameter and step
@@ -177,6 +359,46 @@ def subgradient_descent(  # pylint: disable=too-many-arguments,too-many-position
             argmax (True), instead of minimizing the
             objective to find the argmin (False).
             Defaults to False.
+        return_history (bool): Whether to return the
+            convergence history (True), or an empty
+            history (False). Defaults to True.
+        log_every (int): Number of iterations between
+            entries in the convergence history. The last
+            iteration is always recorded, so callers which
+            only need the final state can pass max_iter.
+            The objective function is only evaluated for
+            recorded iterations. Defaults to 1.
+        grad_funcs (list[callable] | None): The list of
+            the (sub)gradients of the functions in the
+            objective, in the same order as funcs. If given,
+            they are used instead of a finite difference
+            method. As for funcs, a list of the same function
+            repeated is called once on the whole vector of
+            coordinates. Defaults to None.
+        backend (str): The backend running the descent,
+            "numpy", or "jax" to compile the whole loop with
+            JAX and differentiate funcs (which must then be
+            traceable by JAX) automatically, ignoring
+            grad_funcs. The "jax" backend requires jax to be
+            installed. Defaults to "numpy".
+        compile_funcs (bool): Whether to try to compile
+            funcs with numba (True), when they are all the
+            same function of a vector, or up to
+            MAX_GENERATED_FUNCS functions of a single
+            coordinate, so that the whole loop runs in
+            compiled code as for already compiled
+            functions. The compiled objective is cached, so
+            it is only compiled once for repeated calls.
+            If numba cannot compile it, the loop runs in
+            python as usual. Defaults to False.
+        inner_solver (str): The method minimizing the
+            Augmented Lagrangian between updates of lambda
+            and rho: "subgradient" for a single projected
+            subgradient step, or "lbfgs" to minimize it with
+            scipy's L-BFGS-B, with the bounds 0 <= x_i <= 1.
+            With "lbfgs", eta_0 and gamma are not used, and
+            the backend must be "numpy". Defaults to
+            "subgradient".
 
     Returns:
         tuple: (
@@ -185,54 +407,279 @@ def subgradient_descent(  # pylint: disable=too-many-arguments,too-many-position
             Lagrange multiplier lambda,
             history
         )
+
+    Raises:
+        ValueError: If backend is not "numpy" or "jax", or
+            inner_solver is not "subgradient" or "lbfgs" (or
+            is "lbfgs" with the "jax" backend).
     """
     # Initialization:
     n = len(funcs)
-    x = (
-        x_0 if x_0 is not None else numpy.ones(n) / n
+    # The objective is multiplied by sign, instead of
+    # checking argmax in each of the helpers:
+    sign = -1.0 if argmax else 1.0
+    _check_solver(backend, inner_solver)
+    if backend == Backends.JAX:
+        return _subgradient_descent_jax(
+            funcs,
+            numpy.array(x_0 if x_0 is not None else numpy.ones(n) / n, float),
+            (max_iter, tol, eta_0, rho_0, beta, gamma),
+            sign,
+            log_every if return_history else 0,
+        )
+    f_compiled = (
+        _compiled_objective(funcs, compile_funcs)
+        if inner_solver == InnerSolvers.SUBGRADIENT and grad_funcs is None
+        else None
+    )
+    if f_compiled is not None:
+        # The whole loop can be run by compiled code:
+        return _subgradient_descent_compiled(
+            f_compiled,
+            numpy.array(x_0 if x_0 is not None else numpy.ones(n) / n, float),
+            (max_iter, tol, eta_0, rho_0, beta, gamma),
+            sign,
+            log_every if return_history else 0,
+        )
+    # The functions are only dispatched on once:
+    evaluate = coordinate_evaluator(tuple(funcs))
+    grad_evaluate = (
+        coordinate_evaluator(tuple(grad_funcs))
+        if grad_funcs is not None
+        else None
+    )
+    x = numpy.array(
+        x_0 if x_0 is not None else numpy.ones(n) / n, dtype=float
     )  # Start with equal distribution, by default.
+    if inner_solver == InnerSolvers.LBFGS:
+        return augmented_lagrangian_lbfgs(
+            lambda y: _obj_and_c(y, evaluate, sign),
+            lambda y: (
+                sign * grad_evaluate(y)
+                if grad_evaluate is not None
+                else compute_subgradient_vec(y, evaluate, sign=sign)
+            ),
+            x,
+            (max_iter, tol, rho_0, beta),
+            log_every if return_history else 0,
+        )
     lambd: float = 0.0  # Initial Lagrange multiplier.
     rho = rho_0
     eta = eta_0
-    history: list[dict[str, Any]] = []  # To store convergence history.
-    c = constraint_violation(x)
+    # To store convergence history, filled in place row by row:
+    n_rows = max_iter if return_history else 0
+    history_iteration = numpy.empty(n_rows, dtype=int)
+    history_x = numpy.empty((n_rows, n))
+    history_objective = numpy.empty(n_rows)
+    history_c = numpy.empty(n_rows)
+    n_logged = 0
+    # constraint_violation(x) is inlined in the loop:
+    c = float(x.sum()) - 1.0
+    # |c| of the previous iteration, for the update of rho:
+    prev_abs_c = numpy.inf
+    # The subgradient and the step are computed in place:
+    subgrad_buf = numpy.empty(n)
 
     for iteration in range(max_iter):
 
         # Compute subgradient:
-        subgrad = compute_subgradient(x, funcs, argmax) + lambd + rho * c
+        if grad_evaluate is not None:
+            numpy.multiply(grad_evaluate(x), sign, out=subgrad_buf)
+        else:
+            compute_subgradient_vec(x, evaluate, sign=sign, out=subgrad_buf)
+        numpy.add(subgrad_buf, lambd + rho * c, out=subgrad_buf)
 
         # Update variables:
-        x -= eta * subgrad
+        numpy.multiply(subgrad_buf, eta, out=subgrad_buf)
+        numpy.subtract(x, subgrad_buf, out=x)
         # Ensure x_i in [0, 1]:
-        x = numpy.clip(x, 0, 1)
+        numpy.clip(x, 0.0, 1.0, out=x)
 
         # Find new constraint violation:
-        c = constraint_violation(x)
+        c = float(x.sum()) - 1.0
 
         # Update Lagrange multiplier:
         lambd += rho * c
 
         # Check convergence
-        history.append(
-            {
-                "iteration": iteration,
-                "x": x.copy(),
-                "c": c,
-                "objective": objective_function(x, funcs, argmax),
-            }
-        )
-        if abs(c) < tol:
+        abs_c = abs(c)
+        converged = abs_c < tol
+        if return_history and (
+            iteration % log_every == 0
+            or converged
+            or iteration == max_iter - 1
+        ):
+            history_iteration[n_logged] = iteration
+            history_x[n_logged] = x
+            history_c[n_logged] = c
+            history_objective[n_logged] = _objective_function(
+                x, evaluate, sign
+            )
+            n_logged += 1
+        if converged:
             break
 
         # Update penalty parameter rho if constraint violation does not improve:
-        if iteration > 0 and abs(history[-2]["c"]) - abs(c) < tol / 10:
+        if prev_abs_c - abs_c < tol / 10:
             rho *= beta
+        prev_abs_c = abs_c
 
         # Update step size (decay):
         eta *= gamma
 
-    return x, objective_function(x, funcs, argmax), lambd, history
+    history = _history_to_dicts(
+        history_iteration[:n_logged],
+        history_x[:n_logged],
+        history_c[:n_logged],
+        history_objective[:n_logged],
+    )
+    return x, _objective_function(x, evaluate, sign), lambd, history
+
+
+def _check_solver(backend: str, inner_solver: str) -> None:
+    """Check the backend and inner solver options of
+    subgradient_descent.
+
+    Args:
+        backend (str): The backend running the descent.
+        inner_solver (str): The method minimizing the
+            Augmented Lagrangian.
+
+    Raises:
+        ValueError: If backend is not "numpy" or "jax", or
+            inner_solver is not "subgradient" or "lbfgs" (or
+            is "lbfgs" with the "jax" backend).
+    """
+    if backend not in tuple(Backends):
+        raise ValueError(f"Unknown backend {backend!r}.")
+    if inner_solver not in tuple(InnerSolvers):
+        raise ValueError(f"Unknown inner solver {inner_solver!r}.")
+    if backend == Backends.JAX and inner_solver == InnerSolvers.LBFGS:
+        raise ValueError("The jax backend only supports subgradient steps.")
+
+
+def _history_to_dicts(
+    history_iteration: numpy.ndarray,
+    history_x: numpy.ndarray,
+    history_c: numpy.ndarray,
+    history_objective: numpy.ndarray,
+) -> list[dict[str, Any]]:
+    """Convert the convergence history of subgradient
+    descent from arrays into a list of dicts, one for
+    each recorded iteration.
+
+    Args:
+        history_iteration (numpy.ndarray): The recorded
+            iterations.
+        history_x (numpy.ndarray): The coordinates x,
+            with a row for each iteration.
+        history_c (numpy.ndarray): The constraint
+            violation at each iteration.
+        history_objective (numpy.ndarray): The objective
+            function value at each iteration.
+
+    Returns:
+        list[dict[str, Any]]: The convergence history.
+    """
+    return [
+        {"iteration": int(iteration), "x": x, "c": c, "objective": objective}
+        for iteration, x, c, objective in zip(
+            history_iteration, history_x, history_c, history_objective
+        )
+    ]
+
+
+def _subgradient_descent_compiled(
+    f_vec: Callable,
+    x: numpy.ndarray,
+    params: tuple[int, float, float, float, float, float],
+    sign: float = 1.0,
+    log_every: int = 1,
+) -> tuple[numpy.ndarray, float, float, list[dict]]:
+    """Perform subgradient descent with descent_core, and
+    convert its history into the format returned by
+    subgradient_descent.
+
+    Args:
+        f_vec (callable): The compiled function in the
+            objective, taking and returning a vector.
+        x (numpy.ndarray): Initial coordinate vector,
+            which is updated in place.
+        params (tuple): The parameters (max_iter, tol,
+            eta_0, rho_0, beta, gamma) of subgradient_descent.
+        sign (float): The multiplier of the objective,
+            -1.0 to maximize the objective and find the
+            argmax, or 1.0 to minimize the objective and
+            find the argmin. Defaults to 1.0.
+        log_every (int): Number of iterations between
+            entries in the convergence history, or 0 to
+            not record any history. Defaults to 1.
+
+    Returns:
+        tuple: (
+            Optimal arguments x,
+            Objective function value at optimal arguments x,
+            Lagrange multiplier lambda,
+            history
+        )
+    """
+    n = len(x)
+    x, lambd, history = descent_core(x, f_vec, *params, sign, log_every)
+    return (
+        x,
+        _objective_function(x, f_vec, sign),
+        lambd,
+        _history_to_dicts(
+            history[:, 0],
+            history[:, 1 : n + 1],
+            history[:, n + 1],
+            history[:, n + 2],
+        ),
+    )
+
+
+def _subgradient_descent_jax(
+    funcs: list[Callable],
+    x: numpy.ndarray,
+    params: tuple[int, float, float, float, float, float],
+    sign: float = 1.0,
+    log_every: int = 1,
+) -> tuple[numpy.ndarray, float, float, list[dict]]:
+    """Perform subgradient descent with the JAX backend, and
+    convert its history into the format returned by
+    subgradient_descent.
+
+    Args:
+        funcs (list[callable]): The list of functions
+            in the objective, traceable by JAX.
+        x (numpy.ndarray): Initial coordinate vector.
+        params (tuple): The parameters (max_iter, tol,
+            eta_0, rho_0, beta, gamma) of subgradient_descent.
+        sign (float): The multiplier of the objective,
+            -1.0 to maximize the objective and find the
+            argmax, or 1.0 to minimize the objective and
+            find the argmin. Defaults to 1.0.
+        log_every (int): Number of iterations between
+            entries in the convergence history, or 0 to
+            not record any history. Defaults to 1.
+
+    Returns:
+        tuple: (
+            Optimal arguments x,
+            Objective function value at optimal arguments x,
+            Lagrange multiplier lambda,
+            history
+        )
+    """
+    # Imported here, so that jax is only loaded when it is used:
+    from kinetic_project.optimizations.subgradient_methods_jax import (  # pylint: disable=import-outside-toplevel
+        subgradient_descent_jax,
+    )
+
+    x, objective, lambd, history = subgradient_descent_jax(
+        funcs, x, params, sign, log_every
+    )
+    return x, objective, lambd, _history_to_dicts(*history)
 
 
 def run_single_initialization(
@@ -255,10 +702,51 @@ def run_single_initialization(
     return subgradient_descent(funcs, x_0=x_0, **kwargs)
 
 
-def run_multiple_initializations_parallel(
+def _init_worker(funcs: list[Callable], kwargs: dict[str, Any]) -> None:
+    """Store the arguments shared by all initializations
+    in a worker process, so they are only sent to it once.
+
+    Args:
+        funcs (list[callable]): The list of functions
+            in the objective.
+        kwargs (dict[str, Any]): Additional keyword
+            arguments to be passed to subgradient_descent.
+    """
+    _WORKER_STATE["funcs"] = funcs
+    _WORKER_STATE["kwargs"] = kwargs
+
+
+def _run_one(
+    x_0: numpy.ndarray,
+) -> tuple[numpy.ndarray, float, float, list[dict]]:
+    """Run a single initialization of the subgradient_descent
+    function in a worker process set up by _init_worker.
+
+    Args:
+        x_0 (numpy.ndarray): Initial coordinate vector.
+
+    Returns:
+        tuple: (
+            Optimal arguments x,
+            Objective function value at optimal arguments x,
+            Lagrange multiplier lambda,
+            history
+        )
+    """
+    return run_single_initialization(
+        (_WORKER_STATE["funcs"], x_0, _WORKER_STATE["kwargs"])
+    )
+
+
+def run_multiple_initializations_parallel(  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
     funcs: list[Callable],
     num_starts: int = 10,
     max_workers: int | None = None,
+    seed: int | None = None,
+    min_starts: int = 1,
+    patience: int | None = None,
+    parallel_backend: str = "mp",
+    min_work_per_thread: int = 1_000_000,
     **kwargs: dict[str, Any],
 ) -> tuple[
     tuple[numpy.ndarray, float, float, list[dict]],
@@ -276,6 +764,29 @@ def run_multiple_initializations_parallel(
             parallel processes to start at a time.
             If None, uses the number of available
             CPUs on the system. Defaults to None.
+        seed (int | None): Seed for the random generator
+            of the initialization points. If None, the
+            points are not reproducible. Defaults to None.
+        min_starts (int): Minimum number of initializations
+            to finish before stopping early. Defaults to 1.
+        patience (int | None): Number of consecutive
+            finished initializations without an improvement
+            of the best objective value, after which the
+            remaining initializations are cancelled. If None,
+            all the initializations are run. Defaults to None.
+        parallel_backend (str): How to run the initializations
+            in parallel: "mp" for a pool of processes, or
+            "numba" for the threads of one compiled loop over
+            all the initializations, in the same process. The
+            "numba" backend requires the functions to be
+            compiled, as for the compiled loop of
+            subgradient_descent (or compile_funcs=True), and
+            does not stop early. Defaults to "mp".
+        min_work_per_thread (int): With the "numba" backend,
+            the initializations are run on one thread unless
+            there are at least this many iterations times
+            coordinates for each thread, as starting threads
+            costs more than short runs. Defaults to 1_000_000.
         **kwargs (dict[str, Any]): Additional keyword
             arguments to be passed to subgradient_descent
             methods.
@@ -294,22 +805,183 @@ def run_multiple_initializations_parallel(
             The second element in the tuple is a list of tuples
             with structure identical to that of the first
             element in the tuple, where each element in the
-            list is from a different initialization.
+            list is from a different finished initialization,
+            in the order of the initializations.
+
+    Raises:
+        ValueError: If parallel_backend is not "mp" or
+            "numba", or is "numba" and the functions are
+            not compiled.
     """
     n = len(funcs)
-    # Generate multiple initial random points:
-    initializations = [numpy.random.rand(n) for _ in range(num_starts)]
-    # Normalize to satisfy the constraint:
-    initializations = [x / numpy.sum(x) for x in initializations]
-
-    # Prepare arguments for parallel processing:
-    args = [(funcs, x_0, kwargs) for x_0 in initializations]
-
-    # Use multiprocessing.Pool to parallelize:
-    with Pool(processes=max_workers) as pool:
-        results = pool.map(run_single_initialization, args)
+    # Generate multiple initial random points, uniformly from the
+    # simplex, so that they already satisfy the constraint:
+    rng = numpy.random.default_rng(seed)
+    initializations = rng.dirichlet(numpy.ones(n), size=num_starts)
+
+    if parallel_backend == ParallelBackends.NUMBA:
+        results = _run_initializations_numba(
+            funcs, initializations, min_work_per_thread, kwargs
+        )
+    elif parallel_backend == ParallelBackends.MP:
+        results = _run_initializations_mp(
+            funcs, initializations, max_workers, (min_starts, patience), kwargs
+        )
+    else:
+        raise ValueError(f"Unknown parallel backend {parallel_backend!r}.")
 
     # Select the best result based on objective value:
     # Minimize objective value:
     best_solution = min(results, key=lambda r: r[1])
     return best_solution, results
+
+
+def _run_initializations_mp(
+    funcs: list[Callable],
+    initializations: numpy.ndarray,
+    max_workers: int | None,
+    early_stop: tuple[int, int | None],
+    kwargs: dict[str, Any],
+) -> list[tuple[numpy.ndarray, float, float, list[dict]]]:
+    """Run initializations of the subgradient_descent
+    function in a pool of processes, for
+    run_multiple_initializations_parallel.
+
+    Args:
+        funcs (list[callable]): The list of functions
+            in the objective.
+        initializations (numpy.ndarray): The initial
+            points, with a row for each initialization.
+        max_workers (int | None): Maximum number of
+            parallel processes to start at a time.
+            If None, uses the number of available
+            CPUs on the system.
+        early_stop (tuple[int, int | None]): The
+            (min_starts, patience) of
+            run_multiple_initializations_parallel.
+        kwargs (dict[str, Any]): Additional keyword
+            arguments to be passed to subgradient_descent.
+
+    Returns:
+        list[tuple]: The results of the finished
+            initializations, in their order.
+    """
+    min_starts, patience = early_stop
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    # The functions are sent to each worker once, and only
+    # the initial points are sent with each task:
+    finished: dict[int, tuple[numpy.ndarray, float, float, list[dict]]] = {}
+    executor = ProcessPoolExecutor(
+        max_workers=max_workers,
+        # Forking after numba's TBB threads ran hangs at exit:
+        mp_context=None if fork_safe() else get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(funcs, kwargs),
+    )
+    try:  # pylint: disable=too-many-try-statements
+        futures = {
+            executor.submit(_run_one, x_0): i
+            for i, x_0 in enumerate(initializations)
+        }
+        best_objective = numpy.inf
+        since_improvement = 0
+        for future in as_completed(futures):
+            result = future.result()
+            finished[futures[future]] = result
+            if result[1] < best_objective:
+                best_objective = result[1]
+                since_improvement = 0
+            else:
+                since_improvement += 1
+            # Stop early once the best result stops improving:
+            if (
+                patience is not None
+                and len(finished) >= min_starts
+                and since_improvement >= patience
+            ):
+                break
+    finally:
+        # A context manager would wait for the running initializations
+        # after an early stop, so the pool is shut down without waiting
+        # for them, and without starting the pending ones:
+        executor.shutdown(
+            wait=len(finished) == len(initializations), cancel_futures=True
+        )
+    return [finished[i] for i in sorted(finished)]
+
+
+def _run_initializations_numba(
+    funcs: list[Callable],
+    initializations: numpy.ndarray,
+    min_work_per_thread: int,
+    kwargs: dict[str, Any],
+) -> list[tuple[numpy.ndarray, float, float, list[dict]]]:
+    """Run initializations of the subgradient_descent
+    function in the compiled loop, on parallel threads,
+    for run_multiple_initializations_parallel.
+
+    Args:
+        funcs (list[callable]): The list of functions
+            in the objective.
+        initializations (numpy.ndarray): The initial
+            points, with a row for each initialization.
+        min_work_per_thread (int): Minimum number of
+            iterations times coordinates for each thread,
+            below which the initializations are run on
+            one thread.
+        kwargs (dict[str, Any]): Additional keyword
+            arguments to be passed to subgradient_descent.
+
+    Returns:
+        list[tuple]: The results of the initializations,
+            in their order.
+
+    Raises:
+        ValueError: If the functions are not compiled, or
+            the arguments of subgradient_descent require a
+            loop other than the compiled one.
+    """
+    # The arguments of subgradient_descent, with its defaults:
+    arguments = inspect.signature(subgradient_descent).bind(funcs, **kwargs)
+    arguments.apply_defaults()
+    args = arguments.arguments
+    f_compiled = (
+        _compiled_objective(funcs, args["compile_funcs"])
+        if args["grad_funcs"] is None
+        and args["backend"] == Backends.NUMPY
+        and args["inner_solver"] == InnerSolvers.SUBGRADIENT
+        else None
+    )
+    if f_compiled is None:
+        raise ValueError("The numba backend requires compiled functions.")
+    sign = -1.0 if args["argmax"] else 1.0
+    params = tuple(
+        args[name]
+        for name in ("max_iter", "tol", "eta_0", "rho_0", "beta", "gamma")
+    )
+    work = len(initializations) * args["max_iter"] * len(funcs)
+    xs, lambdas, histories, n_logged = descent_many(
+        initializations,
+        f_compiled,
+        params,
+        sign,
+        args["log_every"] if args["return_history"] else 0,
+        parallel=work >= min_work_per_thread * get_num_threads(),
+    )
+    n = len(funcs)
+    return [
+        (
+            x,
+            _objective_function(x, f_compiled, sign),
+            float(lambd),
+            _history_to_dicts(
+                history[:rows, 0],
+                history[:rows, 1 : n + 1],
+                history[:rows, n + 1],
+                history[:rows, n + 2],
+            ),
+        )
+        for x, lambd, history, rows in zip(xs, lambdas, histories, n_logged)
+    ]
@@ -0,0 +1,128 @@
+"""This file contains the Subgradient Descent method
+using the Augmented Lagrangian from several initial
+points at once, in one process."""
+
+from collections.abc import Callable
+
+import numpy
+
+from kinetic_project.optimizations.subgradient_methods import (
+    compute_subgradient_vec,
+)
+from kinetic_project.optimizations.subgradient_methods_evaluators import (
+    coordinate_evaluator,
+)
+
+
+def subgradient_descent_batched(  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+    funcs: list[Callable],
+    x_0: numpy.ndarray,
+    max_iter: int = 1000,
+    tol: float = 1e-6,
+    eta_0: float = 0.01,
+    rho_0: float = 1.0,
+    beta: float = 1.5,
+    gamma: float = 0.9,
+    argmax: bool = False,
+    grad_funcs: list[Callable] | None = None,
+) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """Perform subgradient descent from several initial
+    points at once, in one process, with each step applied
+    to all the points as one array operation. Each point
+    follows the same iterations as subgradient_descent,
+    with its own Lagrange multiplier, penalty parameter
+    and step size, and stops moving once it satisfies the
+    constraint. No convergence history is recorded.
+
+    Parameters:
+        funcs (list[callable]): The list of functions
+            in the objective.
+        x_0 (numpy.ndarray): Initial coordinate vectors,
+            with a row for each initial point.
+        max_iter (int): Maximum number of iterations.
+            Defaults to 1000.
+        tol (float): Tolerance for convergence.
+            Defaults to 1e-6.
+        eta_0 (float): Initial step size.
+            Defaults to 0.01.
+        rho_0 (float): Initial penalty parameter.
+            Defaults to 1.0.
+        beta (float): Factor to increase rho.
+            Defaults to 1.5.
+        gamma (float): Reduction factor for step size.
+            Defaults to 0.9.
+        argmax (bool): Whether to invert the objective
+            to maximize the objective and find the
+            argmax (True), instead of minimizing the
+            objective to find the argmin (False).
+            Defaults to False.
+        grad_funcs (list[callable] | None): The list of
+            the (sub)gradients of the functions in the
+            objective, in the same order as funcs. If given,
+            they are used instead of a finite difference
+            method. Defaults to None.
+
+    Returns:
+        tuple: (
+            Optimal arguments x, with a row for each
+                initial point,
+            Objective function values at each row of x,
+            Lagrange multipliers lambda of each row of x
+        )
+    """
+    sign = -1.0 if argmax else 1.0
+    # The evaluators broadcast over the rows of x:
+    evaluate = coordinate_evaluator(tuple(funcs))
+    grad_evaluate = None
+    if grad_funcs is not None:
+        grad_evaluate = coordinate_evaluator(tuple(grad_funcs))
+    x = numpy.array(x_0, dtype=float)
+    n_starts = x.shape[0]
+    lambd = numpy.zeros(n_starts)
+    rho = numpy.full(n_starts, rho_0)
+    eta = numpy.full(n_starts, eta_0)
+    c = x.sum(axis=1) - 1.0
+    prev_abs_c = numpy.full(n_starts, numpy.inf)
+    # The rows which have not converged yet:
+    active = numpy.ones(n_starts, dtype=bool)
+    subgrad_buf = numpy.empty_like(x)
+
+    for _ in range(max_iter):
+
+        # Compute subgradient of every row:
+        if grad_evaluate is not None:
+            numpy.multiply(grad_evaluate(x), sign, out=subgrad_buf)
+        else:
+            compute_subgradient_vec(x, evaluate, sign=sign, out=subgrad_buf)
+        numpy.add(subgrad_buf, (lambd + rho * c)[:, None], out=subgrad_buf)
+
+        # Update variables of the active rows, leaving the converged
+        # rows in place even where their subgradient is not finite:
+        numpy.multiply(subgrad_buf, eta[:, None], out=subgrad_buf)
+        subgrad_buf[~active] = 0.0
+        numpy.subtract(x, subgrad_buf, out=x)
+        # Ensure x_i in [0, 1]:
+        numpy.clip(x, 0.0, 1.0, out=x)
+
+        # Find new constraint violations, and update
+        # Lagrange multipliers:
+        c = x.sum(axis=1) - 1.0
+        lambd += numpy.where(active, rho * c, 0.0)
+
+        # Check convergence:
+        abs_c = numpy.abs(c)
+        active &= abs_c >= tol
+        if not active.any():
+            break
+
+        # Update penalty parameters rho if constraint violations do not improve:
+        rho = numpy.where(
+            active & (prev_abs_c - abs_c < tol / 10), rho * beta, rho
+        )
+        prev_abs_c = abs_c
+
+        # Update step sizes (decay):
+        eta = numpy.where(active, eta * gamma, eta)
+
+    objectives = sign * evaluate(x).sum(axis=1)
+    return x, objectives, lambd
@@ -0,0 +1,99 @@
+"""This file contains the evaluators of the functions
+in the objective of the Subgradient Descent method
+using the Augmented Lagrangian, which apply each
+function to its coordinate of a vector in one call."""
+
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+
+import numpy
+
+# The number of functions up to which coordinate_evaluator
+# generates code calling each of them, so that the generated
+# source stays small:
+MAX_GENERATED_FUNCS = 200
+
+
+@lru_cache(maxsize=64)
+def coordinate_evaluator(funcs: tuple[Callable, ...]) -> Callable:
+    """Build a function which evaluates each function
+    in the objective at its coordinate, in one call,
+    once for all calls with the same functions.
+    If all the functions are the same function, it is
+    called once on the whole vector of coordinates
+    (falling back to one call per coordinate from then
+    on, if it does not support numpy arrays). Otherwise the
+    functions are called from generated code, for up to
+    MAX_GENERATED_FUNCS functions, or from a numpy
+    ufunc, instead of from a python loop.
+
+    Args:
+        funcs (tuple[callable, ...]): The functions
+            in the objective.
+
+    Returns:
+        callable: A function taking the vector of
+            coordinates x, and returning the vector
+            of values funcs[i](x[i]).
+    """
+    idx = numpy.arange(len(funcs))
+    evaluate_each = numpy.frompyfunc(lambda i, v: funcs[int(i)](v), 2, 1)
+
+    def evaluate_elementwise(x: numpy.ndarray) -> numpy.ndarray:
+        return evaluate_each(idx, x).astype(float)
+
+    if len({id(f) for f in funcs}) != 1:
+        if len(funcs) <= MAX_GENERATED_FUNCS:
+            return _generated_evaluator(funcs, evaluate_elementwise)
+        return evaluate_elementwise
+    f_vec = funcs[0]
+    # Set once f_vec is found not to support numpy arrays:
+    elementwise: list[bool] = []
+
+    def evaluate(x: numpy.ndarray) -> numpy.ndarray:
+        if elementwise:
+            return evaluate_elementwise(x)
+        try:
+            values = numpy.asarray(f_vec(x), dtype=float)
+        except (TypeError, ValueError):
+            values = None
+        if values is None or values.shape != x.shape:
+            elementwise.append(True)
+            return evaluate_elementwise(x)
+        return values
+
+    return evaluate
+
+
+def _generated_evaluator(
+    funcs: tuple[Callable, ...], fallback: Callable
+) -> Callable:
+    """Generate a function which evaluates each function
+    in the objective at its coordinate of a vector, with
+    the calls written out one after the other, so that
+    there is no dispatch on the function of each coordinate.
+
+    Args:
+        funcs (tuple[callable, ...]): The functions
+            in the objective.
+        fallback (callable): The evaluator used instead
+            for arrays which are not a single vector, such
+            as the rows of subgradient_descent_batched.
+
+    Returns:
+        callable: A function taking the vector of
+            coordinates x, and returning the vector
+            of values funcs[i](x[i]).
+    """
+    calls = ", ".join(f"_f{i}(x[{i}])" for i in range(len(funcs)))
+    source = (
+        "def evaluate(x):\n"
+        "    if x.ndim != 1:\n"
+        "        return _fallback(x)\n"
+        f"    return _array([{calls}], dtype=float)\n"
+    )
+    namespace: dict[str, Any] = {f"_f{i}": f for i, f in enumerate(funcs)}
+    namespace.update(_fallback=fallback, _array=numpy.array)
+    exec(source, namespace)  # pylint: disable=exec-used
+    return namespace["evaluate"]
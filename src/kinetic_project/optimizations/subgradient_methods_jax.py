@@ -0,0 +1,145 @@
+"""This file contains the JAX backend of the Subgradient
+Descent method using the Augmented Lagrangian, which
+differentiates the objective automatically and compiles
+the whole descent loop with XLA."""
+
+from collections.abc import Callable
+from typing import Any
+
+import numpy
+
+try:  # pylint: disable=too-many-try-statements
+    import jax
+    import jax.numpy as jnp
+except ImportError:  # pragma: no cover
+    jax = None
+    jnp = None
+
+
+def subgradient_descent_jax(  # pylint: disable=too-many-locals
+    funcs: list[Callable],
+    x_0: numpy.ndarray,
+    params: tuple[int, float, float, float, float, float],
+    sign: float = 1.0,
+    log_every: int = 1,
+) -> tuple[numpy.ndarray, float, float, tuple[numpy.ndarray, ...]]:
+    """Perform the iterations of subgradient_descent with
+    JAX, as a single jax.lax.scan over the iterations,
+    using the exact gradient of the objective from
+    jax.grad. Once the constraint is satisfied, the
+    remaining iterations of the scan leave the state
+    unchanged. The computations use the default
+    precision of JAX, which is float32 unless
+    jax_enable_x64 is set.
+
+    Args:
+        funcs (list[callable]): The list of functions
+            in the objective, which must be traceable by
+            JAX (built from jax.numpy operations). If all
+            the functions are the same function, it is
+            called once on the whole vector of coordinates.
+        x_0 (numpy.ndarray): Initial coordinate vector.
+        params (tuple): The parameters (max_iter, tol,
+            eta_0, rho_0, beta, gamma) of subgradient_descent.
+        sign (float): The multiplier of the objective,
+            -1.0 to maximize the objective and find the
+            argmax, or 1.0 to minimize the objective and
+            find the argmin. Defaults to 1.0.
+        log_every (int): Number of iterations between
+            entries in the convergence history, or 0 to
+            not record any history. Defaults to 1.
+
+    Returns:
+        tuple: (
+            Optimal arguments x,
+            Objective function value at optimal arguments x,
+            Lagrange multiplier lambda,
+            history, as the arrays (iteration, x, c, objective)
+            of the recorded iterations
+        )
+
+    Raises:
+        ImportError: If jax is not installed.
+    """
+    if jax is None:
+        raise ImportError("The jax backend requires jax to be installed.")
+    max_iter, tol, eta_0, rho_0, beta, gamma = params
+
+    if len({id(f) for f in funcs}) == 1:
+        f_vec = funcs[0]
+
+        def f_total(x: Any) -> Any:
+            return sign * jnp.sum(f_vec(x))
+
+    else:
+
+        def f_total(x: Any) -> Any:
+            return sign * sum(f(x[i]) for i, f in enumerate(funcs))
+
+    grad_fn = jax.grad(f_total)
+
+    def step(carry: tuple, iteration: Any) -> tuple[tuple, tuple]:
+        x, lambd, rho, eta, prev_abs_c, done = carry
+        x_new = jnp.clip(
+            x - eta * (grad_fn(x) + lambd + rho * (jnp.sum(x) - 1.0)),
+            0.0,
+            1.0,
+        )
+        c = jnp.sum(x_new) - 1.0
+        # Update penalty parameter rho if constraint violation does not improve:
+        rho_new = jnp.where(
+            (iteration > 0) & (prev_abs_c - jnp.abs(c) < tol / 10),
+            rho * beta,
+            rho,
+        )
+        updated = (
+            x_new,
+            lambd + rho * c,
+            rho_new,
+            eta * gamma,
+            jnp.abs(c),
+            jnp.abs(c) < tol,
+        )
+        # The state is frozen after convergence:
+        carry = jax.tree_util.tree_map(
+            lambda old, new: jnp.where(done, old, new), carry, updated
+        )
+        return carry, (carry[0], c, done)
+
+    @jax.jit
+    def run(x: Any) -> tuple:
+        init = (
+            x,
+            jnp.zeros((), x.dtype),
+            jnp.asarray(rho_0, x.dtype),
+            jnp.asarray(eta_0, x.dtype),
+            jnp.asarray(jnp.inf, x.dtype),
+            jnp.asarray(False),
+        )
+        carry, trace = jax.lax.scan(step, init, jnp.arange(max_iter))
+        return carry[0], carry[1], f_total(carry[0]), trace
+
+    x, lambd, objective, (xs, cs, done_before) = run(jnp.asarray(x_0))
+    # The iterations which were run, before convergence:
+    n_run = int(numpy.count_nonzero(~numpy.asarray(done_before)))
+    iterations = numpy.arange(n_run)
+    iterations = (
+        iterations[(iterations % log_every == 0) | (iterations == n_run - 1)]
+        if log_every > 0
+        else iterations[:0]
+    )
+    history_x = numpy.asarray(xs, dtype=float)[iterations]
+    history_objective = numpy.asarray(
+        jax.vmap(f_total)(jnp.asarray(history_x)), dtype=float
+    ).reshape(len(iterations))
+    return (
+        numpy.asarray(x, dtype=float),
+        float(objective),
+        float(lambd),
+        (
+            iterations,
+            history_x,
+            numpy.asarray(cs, dtype=float)[iterations],
+            history_objective,
+        ),
+    )
@@ -0,0 +1,92 @@
+"""This file contains the L-BFGS-B inner solver of the
+Subgradient Descent method using the Augmented
+Lagrangian, which minimizes the Augmented Lagrangian
+with scipy between the updates of the multipliers."""
+
+from collections.abc import Callable
+from typing import Any
+
+import numpy
+from scipy.optimize import minimize
+
+
+def augmented_lagrangian_lbfgs(  # pylint: disable=too-many-locals
+    obj_and_c: Callable,
+    subgradient: Callable,
+    x: numpy.ndarray,
+    params: tuple[int, float, float, float],
+    log_every: int = 1,
+) -> tuple[numpy.ndarray, float, float, list[dict]]:
+    """Perform the iterations of subgradient_descent with
+    inner_solver="lbfgs": each iteration minimizes the
+    Augmented Lagrangian over the box 0 <= x_i <= 1 with
+    scipy's L-BFGS-B, then updates lambda and rho.
+
+    Args:
+        obj_and_c (callable): The function returning
+            the objective function, already multiplied by
+            the sign of the objective, and the constraint
+            violation c(x) at once.
+        subgradient (callable): The (sub)gradient of the
+            objective function, taking and returning a
+            vector.
+        x (numpy.ndarray): Initial coordinate vector.
+        params (tuple): The parameters (max_iter, tol,
+            rho_0, beta) of subgradient_descent.
+        log_every (int): Number of iterations between
+            entries in the convergence history, or 0 to
+            not record any history. Defaults to 1.
+
+    Returns:
+        tuple: (
+            Optimal arguments x,
+            Objective function value at optimal arguments x,
+            Lagrange multiplier lambda,
+            history
+        )
+    """
+    max_iter, tol, rho, beta = params
+    lambd = 0.0
+    prev_abs_c = numpy.inf
+    bounds = [(0.0, 1.0)] * len(x)
+    history: list[dict[str, Any]] = []
+
+    def lagrangian(y: numpy.ndarray) -> float:
+        y_objective, y_c = obj_and_c(y)
+        return y_objective + lambd * y_c + 0.5 * rho * y_c**2
+
+    def lagrangian_grad(y: numpy.ndarray) -> numpy.ndarray:
+        return subgradient(y) + (lambd + rho * (float(y.sum()) - 1.0))
+
+    # The objective at x_0, if no iteration is run:
+    objective, _ = obj_and_c(x)
+    for iteration in range(max_iter):
+        x = minimize(
+            lagrangian,
+            x,
+            method="L-BFGS-B",
+            jac=lagrangian_grad,
+            bounds=bounds,
+            options={"ftol": 1e-7, "gtol": 1e-9, "maxiter": 100},
+        ).x
+        objective, c = obj_and_c(x)
+        lambd += rho * c
+        converged = abs(c) < tol
+        # The last iteration is always recorded:
+        last = converged or iteration == max_iter - 1
+        if log_every > 0 and (last or iteration % log_every == 0):
+            history.append(
+                {
+                    "iteration": iteration,
+                    "x": x.copy(),
+                    "c": c,
+                    "objective": objective,
+                }
+            )
+        if converged:
+            break
+        # Update penalty parameter rho if constraint violation does not improve:
+        if prev_abs_c - abs(c) < tol / 10:
+            rho *= beta
+        prev_abs_c = abs(c)
+    return x, objective, lambd, history
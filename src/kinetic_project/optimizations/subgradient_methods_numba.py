@@ -0,0 +1,271 @@
+"""This file contains the compiled (numba) loop of the
+Subgradient Descent method using the Augmented
+Lagrangian, for an objective given by one compiled
+function of the whole vector of coordinates, and the
+compilation of the functions in objectives into one."""
+
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+
+import numpy
+
+from kinetic_project.jit import NumbaError, is_jitted, njit, prange, try_njit
+
+# The fast math flags of the compiled loops: all of them but nnan and
+# ninf, since the loops compare against an infinite |c| before the
+# first iteration, and the objective may overflow:
+FASTMATH_FLAGS = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+@lru_cache(maxsize=64)
+def compile_vector_function(f: Callable) -> Callable | None:
+    """Compile a function in the objective with numba,
+    for a vector of coordinates, once for all calls
+    of subgradient_descent. The compiled function is
+    called once on a vector, since functions of a single
+    coordinate (e.g., with a branch on the coordinate)
+    may compile for vectors and only fail when called.
+
+    Args:
+        f (callable): The function to compile, which
+            may already be compiled.
+
+    Returns:
+        callable | None: The compiled function, if numba
+            compiles it to a function returning a vector
+            of the same length as its argument, and None
+            otherwise.
+    """
+    if (
+        compiled := f if is_jitted(f) else try_njit(f, numpy.empty(1))
+    ) is None:
+        return None
+    probe = numpy.zeros(2)
+    try:
+        values = compiled(probe)
+    except (NumbaError, TypeError, ValueError):
+        return None
+    return compiled if numpy.shape(values) == probe.shape else None
+
+
+@lru_cache(maxsize=64)
+def compile_coordinate_functions(
+    funcs: tuple[Callable, ...],
+) -> Callable | None:
+    """Compile a function applying each function in the
+    objective to its coordinate of a vector, with numba,
+    once for all calls of subgradient_descent. The calls
+    are written out one after the other in generated
+    code, so that numba specializes each of them.
+
+    Args:
+        funcs (tuple[callable, ...]): The functions in the
+            objective, each of a single coordinate. Those
+            which are not compiled yet are compiled.
+
+    Returns:
+        callable | None: The compiled function, taking and
+            returning a vector, if numba compiles all the
+            functions to functions returning a scalar, and
+            None otherwise.
+    """
+    namespace: dict[str, Any] = {"_empty": numpy.empty}
+    for i, f in enumerate(funcs):
+        namespace[f"_f{i}"] = f if is_jitted(f) else try_njit(f, 0.0)
+        if namespace[f"_f{i}"] is None:
+            return None
+    source = "def evaluate(x):\n    out = _empty(x.shape)\n" + "".join(
+        f"    out[{i}] = _f{i}(x[{i}])\n" for i in range(len(funcs))
+    )
+    exec(source + "    return out\n", namespace)  # pylint: disable=exec-used
+    return try_njit(namespace["evaluate"], numpy.empty(len(funcs)))
+
+
+# Not cached: numba specializes this function on the function f_vec
+# itself, so a cache entry written by one process is never reused
+# by another, and only accumulates on disk:
+@njit(fastmath=FASTMATH_FLAGS)
+def descent_core(  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+    x: numpy.ndarray,
+    f_vec: Callable,
+    max_iter: int,
+    tol: float,
+    eta: float,
+    rho: float,
+    beta: float,
+    gamma: float,
+    sign: float,
+    log_every: int,
+) -> tuple[numpy.ndarray, float, numpy.ndarray]:
+    """Perform the iterations of subgradient_descent in
+    compiled (numba) code, for an objective whose
+    functions are all the same compiled function,
+    which is applied to the whole vector of coordinates.
+
+    Args:
+        x (numpy.ndarray): Initial coordinate vector,
+            which is updated in place.
+        f_vec (callable): The compiled function in the
+            objective, taking and returning a vector.
+        max_iter (int): Maximum number of iterations.
+        tol (float): Tolerance for convergence.
+        eta (float): Initial step size.
+        rho (float): Initial penalty parameter.
+        beta (float): Factor to increase rho.
+        gamma (float): Reduction factor for step size.
+        sign (float): -1.0 to maximize the objective,
+            or 1.0 to minimize it.
+        log_every (int): Number of iterations between
+            entries in the history, or 0 to not record
+            any history.
+
+    Returns:
+        (numpy.ndarray, float, numpy.ndarray): The optimal
+            arguments x, the Lagrange multiplier lambda, and
+            the history, with a row of the iteration, x, c
+            and the objective for each recorded iteration.
+    """
+    n = len(x)
+    epsilon = 1e-6
+    history = numpy.empty((max_iter if log_every > 0 else 0, n + 3))
+    lambd = 0.0
+    c = x.sum() - 1.0
+    prev_abs_c = numpy.inf
+    n_logged = 0
+    for iteration in range(max_iter):
+        subgrad = (
+            sign * (f_vec(x + epsilon) - f_vec(x - epsilon)) / (2 * epsilon)
+        )
+        x -= eta * (subgrad + lambd + rho * c)
+        numpy.clip(x, 0.0, 1.0, out=x)
+        c = x.sum() - 1.0
+        lambd += rho * c
+        abs_c = abs(c)
+        converged = abs_c < tol
+        if log_every > 0 and (
+            iteration % log_every == 0
+            or converged
+            or iteration == max_iter - 1
+        ):
+            history[n_logged, 0] = iteration
+            history[n_logged, 1 : n + 1] = x
+            history[n_logged, n + 1] = c
+            history[n_logged, n + 2] = sign * f_vec(x).sum()
+            n_logged += 1
+        if converged:
+            break
+        eta *= gamma
+        # Update penalty parameter rho if constraint violation does not improve:
+        if prev_abs_c - abs_c < tol / 10:
+            rho *= beta
+        prev_abs_c = abs_c
+    return x, lambd, history[:n_logged]
+
+
+def descent_many(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    x_0s: numpy.ndarray,
+    f_vec: Callable,
+    params: tuple[int, float, float, float, float, float],
+    sign: float = 1.0,
+    log_every: int = 1,
+    parallel: bool = True,
+) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """Perform the iterations of subgradient_descent with
+    descent_core from several initial points, on parallel
+    threads or one after the other.
+
+    Args:
+        x_0s (numpy.ndarray): Initial coordinate vectors,
+            with a row for each initial point.
+        f_vec (callable): The compiled function in the
+            objective, taking and returning a vector.
+        params (tuple): The parameters (max_iter, tol,
+            eta_0, rho_0, beta, gamma) of subgradient_descent.
+        sign (float): -1.0 to maximize the objective,
+            or 1.0 to minimize it. Defaults to 1.0.
+        log_every (int): Number of iterations between
+            entries in the history, or 0 to not record
+            any history. Defaults to 1.
+        parallel (bool): Whether to run the initial points
+            on parallel threads (True), or one after the
+            other (False). Defaults to True.
+
+    Returns:
+        (numpy.ndarray, numpy.ndarray, numpy.ndarray,
+            numpy.ndarray): The optimal arguments x and the
+            Lagrange multipliers lambda of each initial point,
+            the histories of descent_core of each initial
+            point, padded to the same number of rows, and the
+            number of rows of each history.
+    """
+    max_iter = params[0]
+    n_rows = (max_iter - 1) // log_every + 2 if log_every > 0 else 0
+    xs = numpy.array(x_0s, dtype=float)
+    lambdas = numpy.empty(len(xs))
+    histories = numpy.empty((len(xs), n_rows, xs.shape[1] + 3))
+    n_logged = numpy.empty(len(xs), dtype=numpy.int64)
+    if parallel:
+        _descent_many_parallel(
+            xs, f_vec, *params, sign, log_every, lambdas, histories, n_logged
+        )
+    else:
+        for i, x in enumerate(xs):
+            _, lambdas[i], history = descent_core(
+                x, f_vec, *params, sign, log_every
+            )
+            histories[i, : len(history)] = history
+            n_logged[i] = len(history)
+    return xs, lambdas, histories, n_logged
+
+
+# Not cached, as descent_core:
+@njit(parallel=True, fastmath=FASTMATH_FLAGS)
+def _descent_many_parallel(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    xs: numpy.ndarray,
+    f_vec: Callable,
+    max_iter: int,
+    tol: float,
+    eta: float,
+    rho: float,
+    beta: float,
+    gamma: float,
+    sign: float,
+    log_every: int,
+    lambdas: numpy.ndarray,
+    histories: numpy.ndarray,
+    n_logged: numpy.ndarray,
+) -> None:
+    """Perform the iterations of descent_core from several
+    initial points, on parallel threads, for descent_many.
+
+    Args:
+        xs (numpy.ndarray): Initial coordinate vectors,
+            with a row for each initial point, which are
+            updated in place.
+        f_vec (callable): The compiled function in the
+            objective, taking and returning a vector.
+        max_iter (int): Maximum number of iterations.
+        tol (float): Tolerance for convergence.
+        eta (float): Initial step size.
+        rho (float): Initial penalty parameter.
+        beta (float): Factor to increase rho.
+        gamma (float): Reduction factor for step size.
+        sign (float): -1.0 to maximize the objective,
+            or 1.0 to minimize it.
+        log_every (int): Number of iterations between
+            entries in the history, or 0 to not record
+            any history.
+        lambdas (numpy.ndarray): Output array of the
+            Lagrange multiplier of each initial point.
+        histories (numpy.ndarray): Output array of the
+            history of each initial point.
+        n_logged (numpy.ndarray): Output array of the
+            number of rows of each history.
+    """
+    for i in prange(xs.shape[0]):  # pylint: disable=not-an-iterable
+        _, lambdas[i], history = descent_core(
+            xs[i], f_vec, max_iter, tol, eta, rho, beta, gamma, sign, log_every
+        )
+        histories[i, : history.shape[0]] = history
+        n_logged[i] = history.shape[0]
@@ -0,0 +1,14 @@
+"""This file contains fixtures for use in all the pytest unit tests."""
+
+import os
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def max_workers():
+    """Sample fixture of the maximum number of processes for the tests of
+    process pools, which share the CPUs between the workers of pytest-xdist
+    so that the pools of parallel tests do not oversubscribe them."""
+    n_workers = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1"))
+    return max(1, (os.cpu_count() or 1) // n_workers)
@@ -8,10 +8,13 @@ import pytest
 
 from kinetic_project.graphs.deg_ops import (
     AllowedDegs,
+    csr_in_deg,
+    csr_out_deg,
     in_deg,
     in_or_out_deg,
     out_deg,
 )
+from kinetic_project.graphs.graph_mat_conversions import mat_to_csr
 
 
 def test_in_or_out_deg_in_degree():
@@ -23,9 +26,9 @@ def test_in_or_out_deg_in_degree():
             [1, 0, 0],
         ]
     )
-    verts = numpy.array([[1], [1], [1]])
+    verts = numpy.array([1, 1, 1])
     result = in_or_out_deg(A, AllowedDegs.IN, verts)
-    expected = numpy.array([[1], [1], [1]])
+    expected = numpy.array([1, 1, 1])
     assert numpy.array_equal(
         result, expected
     ), "In-degree calculation is incorrect."
@@ -40,9 +43,9 @@ def test_in_or_out_deg_out_degree():
             [1, 0, 0],
         ]
     )
-    verts = numpy.array([[1], [1], [1]])
+    verts = numpy.array([1, 1, 1])
     result = in_or_out_deg(A, AllowedDegs.OUT, verts)
-    expected = numpy.array([[1], [1], [1]])
+    expected = numpy.array([1, 1, 1])
     assert numpy.array_equal(
         result, expected
     ), "Out-degree calculation is incorrect."
@@ -56,7 +59,7 @@ def test_in_or_out_deg_invalid_enum():
             [1, 0],
         ]
     )
-    verts = numpy.array([[1], [1]])
+    verts = numpy.array([1, 1])
     if sys.version_info[0] == 3 and sys.version_info[1] < 12:
         with pytest.raises(TypeError):
             in_or_out_deg(A, "invalid_enum", verts)
@@ -75,7 +78,7 @@ def test_in_deg():
         ]
     )
     result = in_deg(A)
-    expected = numpy.array([[1], [1], [1]])
+    expected = numpy.array([1, 1, 1])
     assert numpy.array_equal(
         result, expected
     ), "In-degree function is incorrect."
@@ -91,7 +94,7 @@ def test_out_deg():
         ]
     )
     result = out_deg(A)
-    expected = numpy.array([[1], [1], [1]])
+    expected = numpy.array([1, 1, 1])
     assert numpy.array_equal(
         result, expected
     ), "Out-degree function is incorrect."
@@ -106,19 +109,19 @@ def test_in_or_out_deg_with_partial_vertices():
             [1, 0, 0],
         ]
     )
-    verts = numpy.array([[1], [0], [1]])  # Only vertices 0 and 2 are active.
+    verts = numpy.array([1, 0, 1])  # Only vertices 0 and 2 are active.
     in_result = in_or_out_deg(A, AllowedDegs.IN, verts)
     out_result = in_or_out_deg(A, AllowedDegs.OUT, verts)
     # Note: the function `in_or_out_deg doesn't remove vertices or edges.
     # That is part of the job of the function `validate_graph_sink_source_condition`.
     # Therefore, though vertex 1 is not active, and the values
-    # expected_in = numpy.array([[1], [0], [0]])
-    # expected_out = numpy.array([[0], [0], [1]])
+    # expected_in = numpy.array([1, 0, 0])
+    # expected_out = numpy.array([0, 0, 1])
     # may be the final output of this stage, in_or_out_deg only
     # calculates the degrees from the given matrix, so the expected
     # outputs are actually as follows:
-    expected_in = numpy.array([[1], [0], [1]])
-    expected_out = numpy.array([[1], [0], [1]])
+    expected_in = numpy.array([1, 0, 1])
+    expected_out = numpy.array([1, 0, 1])
     assert numpy.array_equal(
         in_result, expected_in
     ), "In-degree with partial vertices is incorrect."
@@ -131,7 +134,7 @@ def test_in_deg_with_graph_object():
     """Tests the function in_or_out_deg with a networkx.Graph object input."""
     G = networkx.DiGraph([(0, 1), (1, 2), (2, 0)])
     result = in_deg(G)
-    expected = numpy.array([[1], [1], [1]])
+    expected = numpy.array([1, 1, 1])
     assert numpy.array_equal(
         result, expected
     ), "In-degree for networkx.Graph is incorrect."
@@ -141,7 +144,7 @@ def test_out_deg_with_graph_object():
     """Tests the function out_deg with a networkx.Graph object input."""
     G = networkx.DiGraph([(0, 1), (1, 2), (2, 0)])
     result = out_deg(G)
-    expected = numpy.array([[1], [1], [1]])
+    expected = numpy.array([1, 1, 1])
     assert numpy.array_equal(
         result, expected
     ), "Out-degree for networkx.Graph is incorrect."
@@ -167,7 +170,33 @@ def test_in_or_out_deg_without_active_vertices():
     )
     verts = None
     result = in_or_out_deg(A, AllowedDegs.IN, verts)
-    expected = numpy.array([[1], [1], [1]])
+    expected = numpy.array([1, 1, 1])
     assert numpy.array_equal(
         result, expected
     ), "In-degree should handle None vertices correctly."
+
+
+def test_csr_in_and_out_deg():
+    """Tests the functions csr_in_deg and csr_out_deg."""
+    # CSR representation of [[0, 1, 1], [0, 0, 1], [0, 0, 0]]:
+    indptr = numpy.array([0, 2, 3, 3])
+    indices = numpy.array([1, 2, 2])
+    assert numpy.array_equal(
+        csr_in_deg(indptr), [2, 1, 0]
+    ), "CSR in-degree calculation is incorrect."
+    assert numpy.array_equal(
+        csr_out_deg(indices, 3), [0, 1, 2]
+    ), "CSR out-degree calculation is incorrect."
+
+
+def test_csr_degs_match_dense_degs():
+    """Tests that the functions csr_in_deg and csr_out_deg agree with
+    the functions in_deg and out_deg."""
+    A = (numpy.random.default_rng(0).random((5, 5)) < 0.5).astype(int)
+    indptr, indices = mat_to_csr(A)
+    assert numpy.array_equal(
+        csr_in_deg(indptr), in_deg(A)
+    ), "CSR and dense in-degrees should be the same."
+    assert numpy.array_equal(
+        csr_out_deg(indices, 5), out_deg(A)
+    ), "CSR and dense out-degrees should be the same."
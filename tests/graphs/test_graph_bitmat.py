@@ -0,0 +1,82 @@
+"""This file contains tests for the functions in the graph_bitmat.py module."""
+
+import numpy
+import pytest
+
+from kinetic_project.graphs.graph_bitmat import (
+    MAX_BITMAT_DIM,
+    bit_is_set,
+    bits_to_verts,
+    from_numpy,
+    popcount,
+    to_numpy,
+    verts_to_bits,
+)
+
+
+def test_from_numpy_valid_conversion():
+    """This function tests that the conversion from a matrix to a bitmatrix produces the expected result."""
+    adjacency_matrix = numpy.array(
+        [
+            [0, 1, 1],
+            [0, 0, 0],
+            [2, 0, 0],
+        ]
+    )
+    rows = from_numpy(adjacency_matrix)
+    assert rows.dtype == numpy.uint64, "Bitmatrix rows should be uint64."
+    assert numpy.array_equal(
+        rows, [6, 0, 1]
+    ), "Bitmatrix rows should match expected output."
+
+
+def test_from_numpy_and_back():
+    """This function tests that the conversion from a matrix to a bitmatrix and back produces the expected result."""
+    rng = numpy.random.default_rng(0)
+    adjacency_matrix = rng.integers(
+        0, 2, size=(MAX_BITMAT_DIM, MAX_BITMAT_DIM)
+    )
+    assert numpy.array_equal(
+        to_numpy(from_numpy(adjacency_matrix), MAX_BITMAT_DIM),
+        adjacency_matrix != 0,
+    ), "Original and reconstructed matrix should be identical."
+
+
+def test_from_numpy_too_many_vertices():
+    """This function tests that the conversion of a matrix with too many vertices raises a ValueError."""
+    dim = MAX_BITMAT_DIM + 1
+    with pytest.raises(ValueError):
+        from_numpy(numpy.ones((dim, dim)))
+
+
+@pytest.mark.parametrize(
+    "x, expected",
+    [
+        (0, 0),
+        (1, 1),
+        (0b1011, 3),
+        (2**63, 1),
+        (2**64 - 1, 64),
+    ],
+)
+def test_popcount(x, expected):
+    """This function tests that popcount counts the set bits of a word."""
+    assert popcount(numpy.uint64(x)) == expected
+
+
+@pytest.mark.parametrize("dim", [3, 70])
+def test_verts_to_bits_and_back(dim):
+    """This function tests that the conversion of a vector of active vertices to a bitset and back leaves it unchanged."""
+    verts = numpy.zeros(dim, dtype=numpy.uint8)
+    verts[[0, dim - 1]] = 1
+    bits = verts_to_bits(verts)
+    assert (
+        len(bits) == (dim + 63) // 64
+    ), "Should use one word per 64 vertices."
+    assert bit_is_set(bits, dim - 1), "Bits of active vertices should be set."
+    assert not bit_is_set(
+        bits, 1
+    ), "Bits of inactive vertices should not be set."
+    assert numpy.array_equal(
+        bits_to_verts(bits, dim), verts
+    ), "The vector should be unchanged."
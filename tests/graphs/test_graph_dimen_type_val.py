@@ -43,6 +43,20 @@ def test_graph_dimen_type_val_with_numpy_array():
     assert dim == 2, "Dimension should match the matrix size."
 
 
+def test_graph_dimen_type_val_without_copy():
+    """Tests the function graph_dimen_type_val with copy=False."""
+    adj_matrix = numpy.array(
+        [
+            [0, 1],
+            [1, 0],
+        ]
+    )
+    result_matrix, _ = graph_dimen_type_val(adj_matrix, copy=False)
+    assert result_matrix is adj_matrix, "Matrix should not be copied."
+    result_matrix, _ = graph_dimen_type_val(adj_matrix)
+    assert result_matrix is not adj_matrix, "Matrix should be copied."
+
+
 def test_graph_dimen_type_val_with_non_square_matrix():
     """Tests the function graph_dimen_type_val with a non-square matrix."""
     adj_matrix = numpy.array(
@@ -65,7 +79,7 @@ def test_dimen_type_val_with_default_verts():
         ]
     )
     result_matrix, verts = dimen_type_val(adj_matrix)
-    expected_verts = numpy.array([[1], [1]])
+    expected_verts = numpy.array([1, 1])
     assert numpy.array_equal(
         result_matrix, adj_matrix
     ), "Adjacency matrix should match the input."
@@ -82,7 +96,7 @@ def test_dimen_type_val_with_custom_verts():
             [1, 0],
         ]
     )
-    verts = numpy.array([[1], [0]])
+    verts = numpy.array([1, 0])
     result_matrix, result_verts = dimen_type_val(adj_matrix, verts)
     assert numpy.array_equal(
         result_matrix, adj_matrix
@@ -92,6 +106,23 @@ def test_dimen_type_val_with_custom_verts():
     ), "Verts vector should match the input."
 
 
+def test_dimen_type_val_with_column_verts():
+    """Tests the function dimen_type_val with an (n by 1) verts vector."""
+    adj_matrix = numpy.array(
+        [
+            [0, 1],
+            [1, 0],
+        ]
+    )
+    verts = numpy.array([[1.0], [0.0]])
+    _, result_verts = dimen_type_val(adj_matrix, verts)
+    assert result_verts.shape == (2,), "Verts vector should be 1-D."
+    assert result_verts.dtype == numpy.uint8, "Verts vector should be uint8."
+    assert numpy.array_equal(
+        result_verts, [1, 0]
+    ), "Verts vector should match the input."
+
+
 def test_dimen_type_val_with_invalid_verts_shape():
     """Tests the function dimen_type_val with invalid verts shape."""
     adj_matrix = numpy.array(
@@ -100,7 +131,7 @@ def test_dimen_type_val_with_invalid_verts_shape():
             [1, 0],
         ]
     )
-    invalid_verts = numpy.array([1, 0])  # Incorrect shape.
+    invalid_verts = numpy.array([1, 0, 1])  # Incorrect shape.
     with pytest.raises(ValueError, match="is not"):
         dimen_type_val(adj_matrix, invalid_verts)
 
@@ -108,7 +139,7 @@ def test_dimen_type_val_with_invalid_verts_shape():
 def test_dimen_type_val_with_networkx_graph_and_custom_verts():
     """Tests the function dimen_type_val with networkx.Graph and custom verts."""
     G = networkx.DiGraph([(0, 1), (1, 2), (2, 0)])
-    verts = numpy.array([[1], [1], [0]])
+    verts = numpy.array([1, 1, 0])
     adj_matrix, result_verts = dimen_type_val(G, verts)
     expected_matrix = numpy.array(
         [
@@ -136,7 +167,7 @@ def test_dimen_type_val_with_networkx_graph_default_verts():
             [1, 0, 0],
         ]
     )
-    expected_verts = numpy.array([[1], [1], [1]])
+    expected_verts = numpy.array([1, 1, 1])
     assert numpy.array_equal(
         adj_matrix, expected_matrix
     ), "Adjacency matrix should match graph conversion."
@@ -3,9 +3,11 @@
 import networkx
 import numpy
 import pytest
+import scipy.sparse
 
 from kinetic_project.graphs.graph_mat_conversions import (
     graph_to_mat,
+    mat_to_csr,
     mat_to_graph,
 )
 
@@ -24,6 +26,36 @@ def test_graph_to_mat_valid_conversion():
     assert numpy.array_equal(
         adjacency_matrix, expected_matrix
     ), "Adjacency matrix should match expected output"
+    assert (
+        adjacency_matrix.dtype == numpy.uint8
+    ), "Adjacency matrix should have an integer dtype."
+
+
+def test_graph_to_mat_weights():
+    """This function tests that the conversion from a graph to a matrix keeps the edges of any weight."""
+    G = networkx.DiGraph()
+    G.add_weighted_edges_from([(0, 1, 0.5), (1, 0, 0.5), (1, 2, 200)])
+    adjacency_matrix = graph_to_mat(G)
+    expected_matrix = numpy.array(
+        [
+            [0, 1, 0],
+            [1, 0, 1],
+            [0, 0, 0],
+        ]
+    )
+    assert numpy.array_equal(
+        adjacency_matrix, expected_matrix
+    ), "Each edge should be counted once, whatever its weight."
+
+
+def test_graph_to_mat_multigraph():
+    """This function tests that the conversion from a multigraph to a matrix counts its parallel edges."""
+    n_edges = 300
+    G = networkx.MultiDiGraph([(0, 1)] * n_edges + [(1, 0)])
+    adjacency_matrix = graph_to_mat(G)
+    assert numpy.array_equal(
+        adjacency_matrix, [[0, n_edges], [1, 0]]
+    ), "Parallel edges should be counted."
 
 
 def test_mat_to_graph_valid_conversion():
@@ -68,6 +100,38 @@ def test_mat_to_graph_with_labels():
     ), "Graph nodes should match the provided labels."
 
 
+def test_mat_to_csr():
+    """This function tests that the conversion from a matrix to CSR arrays produces the expected result."""
+    adjacency_matrix = numpy.array(
+        [
+            [0, 1, 1],
+            [0, 0, 0],
+            [1, 0, 0],
+        ]
+    )
+    indptr, indices = mat_to_csr(adjacency_matrix)
+    assert numpy.array_equal(
+        indptr, [0, 2, 2, 3]
+    ), "CSR index pointer should match expected output."
+    assert numpy.array_equal(
+        indices, [1, 2, 0]
+    ), "CSR column indices should match expected output."
+
+
+def test_mat_to_csr_sparse():
+    """This function tests that the conversion from a sparse matrix to CSR arrays ignores explicitly stored zeros."""
+    adjacency_matrix = scipy.sparse.coo_array(
+        ([1, 1, 0, 1], ([0, 0, 1, 2], [2, 1, 1, 0])), shape=(3, 3)
+    )
+    indptr, indices = mat_to_csr(adjacency_matrix)
+    assert numpy.array_equal(
+        indptr, [0, 2, 2, 3]
+    ), "CSR index pointer should match expected output."
+    assert numpy.array_equal(
+        indices, [1, 2, 0]
+    ), "CSR column indices should match expected output."
+
+
 # Can't actually make the invalid matrix in here. Numpy won't allow it.
 # def test_mat_to_graph_invalid_matrix():
 #     """This function tests that the convertsion from a matrix to a graph with an invalid matrix produces the expected error."""
@@ -1,8 +1,12 @@
 """This file contains tests for the functions in the graph_ops.py module."""
 
+import networkx
 import numpy
+import pytest
+import scipy.sparse
 
 from kinetic_project.graphs.graph_ops import (
+    compile_kernels,
     iterate_subgraphs,
     prune_graph,
     validate_graph_sink_source_condition,
@@ -10,8 +14,17 @@ from kinetic_project.graphs.graph_ops import (
     zero_rows_and_cols,
 )
 
+# The adjacency matrix constructors of the dense and sparse code paths:
+MAT_CTORS = [numpy.asarray, scipy.sparse.csr_matrix]
 
-def test_iterate_subgraphs_basic():
+
+def _to_dense(mat):
+    """Returns a sparse matrix as a numpy array, and any other matrix as is."""
+    return mat.toarray() if scipy.sparse.issparse(mat) else mat
+
+
+@pytest.mark.parametrize("mat_ctor", MAT_CTORS)
+def test_iterate_subgraphs_basic(mat_ctor):
     """Tests the function iterate_subgraphs in a simple case."""
     A = numpy.array(
         [
@@ -19,11 +32,12 @@ def test_iterate_subgraphs_basic():
             [1, 0],
         ]
     )
-    subgraphs = iterate_subgraphs(A)
+    subgraphs = iterate_subgraphs(mat_ctor(A))
     assert len(subgraphs) > 0, "Should return at least one subgraph."
 
 
-def test_iterate_subgraphs_with_constraints():
+@pytest.mark.parametrize("mat_ctor", MAT_CTORS)
+def test_iterate_subgraphs_with_constraints(mat_ctor):
     """Tests the function iterate_subgraphs with a required vertex."""
     A = numpy.array(
         [
@@ -33,7 +47,7 @@ def test_iterate_subgraphs_with_constraints():
         ]
     )
     required_vertices = [0]
-    subgraphs = iterate_subgraphs(A, v=required_vertices)
+    subgraphs = iterate_subgraphs(mat_ctor(A), v=required_vertices)
     # assert all(validate_vertices(verts, required_vertices) for _, verts in subgraphs), \
     #     "All subgraphs should include required vertices."
     assert all(
@@ -41,7 +55,157 @@ def test_iterate_subgraphs_with_constraints():
     ), "All subgraphs should include required vertices."
 
 
-def test_prune_graph():
+@pytest.mark.parametrize("mat_ctor", MAT_CTORS)
+def test_iterate_subgraphs_unique(mat_ctor):
+    """Tests that the function iterate_subgraphs finds each subgraph once."""
+    A = numpy.array(
+        [
+            [0, 1, 1],
+            [1, 0, 1],
+            [1, 1, 0],
+        ]
+    )
+    subgraphs = iterate_subgraphs(mat_ctor(A))
+    keys = [(str(_to_dense(sub_A)), str(verts)) for sub_A, verts in subgraphs]
+    assert len(keys) == len(set(keys)), "Subgraphs should not repeat."
+    assert len(keys) == 21, "All valid subgraphs should be found."
+
+
+@pytest.mark.parametrize("mat_ctor", MAT_CTORS)
+def test_iterate_subgraphs_with_inactive_vertices(mat_ctor):
+    """Tests that the function iterate_subgraphs ignores the edges of inactive vertices."""
+    A = numpy.array(
+        [
+            [0, 1, 1],
+            [1, 0, 1],
+            [1, 1, 0],
+        ]
+    )
+    verts = numpy.array([[1], [1], [0]])
+    subgraphs = iterate_subgraphs(mat_ctor(A), verts)
+    assert len(subgraphs) == 1, "Only the cycle 0-1-0 should remain."
+    assert numpy.array_equal(
+        subgraphs[0][1], [0, 1]
+    ), "Inactive vertices should not be in subgraphs."
+
+
+@pytest.mark.parametrize("mat_ctor", MAT_CTORS)
+def test_iterate_subgraphs_more_than_64_vertices(mat_ctor):
+    """Tests the function iterate_subgraphs on a graph with more than 64 vertices."""
+    A = numpy.zeros((70, 70))
+    A[0, 69] = A[69, 0] = A[69, 65] = A[65, 69] = 1
+    subgraphs = iterate_subgraphs(mat_ctor(A))
+    verts_list = sorted(verts.tolist() for _, verts in subgraphs)
+    assert verts_list == [
+        [0, 65, 69],
+        [0, 69],
+        [65, 69],
+    ], "Vertices beyond the first 64 should be tracked."
+
+
+@pytest.mark.parametrize("mat_ctor", MAT_CTORS)
+def test_iterate_subgraphs_multiple_edges(mat_ctor):
+    """Tests that the function iterate_subgraphs counts an element of n
+    in the adjacency matrix as n edges."""
+    # The cycle 0-1-0 has 3 edges, and the self-loop at 2 has 2 edges:
+    A = numpy.array(
+        [
+            [0, 2, 0],
+            [1, 0, 0],
+            [0, 0, 2],
+        ]
+    )
+    verts_list = sorted(
+        verts.tolist() for _, verts in iterate_subgraphs(mat_ctor(A))
+    )
+    assert verts_list == [
+        [0, 1],
+        [0, 1, 2],
+        [2],
+    ], "A self-loop of 2 edges should be a valid subgraph."
+    verts_list = sorted(
+        verts.tolist() for _, verts in iterate_subgraphs(mat_ctor(A), k=3)
+    )
+    assert verts_list == [[2]], "Only subgraphs of 2 edges should be valid."
+    subgraphs = iterate_subgraphs(mat_ctor(A / 2), k=3)
+    assert sorted(verts.tolist() for _, verts in subgraphs) == [
+        [0, 1],
+        [0, 1, 2],
+    ], "Elements below 1 should only count as part of an edge."
+
+
+def test_iterate_subgraphs_graph_weights():
+    """Tests that the function iterate_subgraphs finds the same subgraphs
+    of a networkx graph whatever the weights of its edges."""
+    edges = [(0, 1), (1, 0), (1, 2), (2, 1)]
+    G = networkx.DiGraph()
+    G.add_weighted_edges_from(
+        (*edge, weight) for edge, weight in zip(edges, [0.5, 0.5, 2, 1])
+    )
+    verts_list = [verts.tolist() for _, verts in iterate_subgraphs(G)]
+    expected_verts_list = [
+        verts.tolist()
+        for _, verts in iterate_subgraphs(networkx.DiGraph(edges))
+    ]
+    assert (
+        verts_list == expected_verts_list
+    ), "Edges should count once, whatever their weights."
+
+
+@pytest.mark.parametrize("dim", [4, 70])
+@pytest.mark.xdist_group("process_pools")
+def test_iterate_subgraphs_parallel(dim, max_workers):
+    """Tests that the function iterate_subgraphs finds the same subgraphs, in the same order, in parallel."""
+    A = numpy.zeros((dim, dim))
+    A[:4, :4] = 1 - numpy.eye(4)
+    subgraphs = iterate_subgraphs(A)
+    # A single worker would run the serial enumeration:
+    parallel_subgraphs = iterate_subgraphs(A, max_workers=max(2, max_workers))
+    assert len(parallel_subgraphs) == len(
+        subgraphs
+    ), "All valid subgraphs should be found."
+    assert all(
+        numpy.array_equal(sub_A, parallel_sub_A)
+        and numpy.array_equal(verts, parallel_verts)
+        for (sub_A, verts), (parallel_sub_A, parallel_verts) in zip(
+            subgraphs, parallel_subgraphs
+        )
+    ), "Subgraphs should be found in the same order."
+
+
+@pytest.mark.parametrize("dim", [5, 70])
+def test_iterate_subgraphs_sparse(dim):
+    """Tests that the function iterate_subgraphs finds the same subgraphs,
+    in the same order, for sparse matrices as for numpy arrays."""
+    A = numpy.zeros((dim, dim))
+    A[:4, :4] = numpy.arange(1, 17).reshape(4, 4) * (1 - numpy.eye(4))
+    A[3, dim - 1] = A[dim - 1, 0] = 1
+    subgraphs = iterate_subgraphs(A)
+    sparse_subgraphs = iterate_subgraphs(scipy.sparse.coo_array(A))
+    assert len(sparse_subgraphs) == len(
+        subgraphs
+    ), "All valid subgraphs should be found."
+    assert all(
+        sparse_sub_A.format == "csr" for sparse_sub_A, _ in sparse_subgraphs
+    ), "Should return CSR matrices."
+    assert all(
+        numpy.array_equal(sub_A, sparse_sub_A.toarray())
+        and numpy.array_equal(verts, sparse_verts)
+        for (sub_A, verts), (sparse_sub_A, sparse_verts) in zip(
+            subgraphs, sparse_subgraphs
+        )
+    ), "Sparse and dense subgraphs should be the same."
+
+
+def test_compile_kernels():
+    """Tests that compile_kernels leaves iterate_subgraphs usable."""
+    compile_kernels()
+    subgraphs = iterate_subgraphs(numpy.ones((2, 2)) - numpy.eye(2))
+    assert len(subgraphs) == 1, "Only the cycle 0-1-0 should be found."
+
+
+@pytest.mark.parametrize("mat_ctor", MAT_CTORS)
+def test_prune_graph(mat_ctor):
     """Tests the function prune_graph."""
     A = numpy.array(
         [
@@ -51,7 +215,7 @@ def test_prune_graph():
         ]
     )
     verts = numpy.array([[1], [1], [0]])
-    pruned_A, pruned_verts = prune_graph(A, verts)
+    pruned_A, pruned_verts = prune_graph(mat_ctor(A), verts)
     assert pruned_A.shape == (
         2,
         2,
@@ -61,7 +225,23 @@ def test_prune_graph():
     ), "Pruned vertices should match active ones."
 
 
-def test_validate_graph_sink_source_condition():
+@pytest.mark.parametrize("fmt", ["csr", "csc", "coo"])
+def test_prune_graph_sparse(fmt):
+    """Tests the function prune_graph on sparse matrices."""
+    dense = numpy.arange(1, 10).reshape(3, 3)
+    A = scipy.sparse.csr_array(dense).asformat(fmt)
+    pruned_A, pruned_verts = prune_graph(A, numpy.array([1, 0, 1]))
+    assert pruned_A.format == fmt, "Should keep the format of the matrix."
+    assert numpy.array_equal(
+        pruned_A.toarray(), [[1, 3], [7, 9]]
+    ), "Pruned matrix should only include active vertices."
+    assert numpy.array_equal(
+        pruned_verts, [0, 2]
+    ), "Pruned vertices should match active ones."
+
+
+@pytest.mark.parametrize("mat_ctor", MAT_CTORS)
+def test_validate_graph_sink_source_condition(mat_ctor):
     """Tests the function validate_graph_sink_source_condition."""
     A = numpy.array(
         [
@@ -72,7 +252,7 @@ def test_validate_graph_sink_source_condition():
     )
     verts = numpy.array([[1], [1], [1]])
     validated_A, validated_verts = validate_graph_sink_source_condition(
-        A, verts
+        mat_ctor(A), verts
     )
     assert validated_A.shape == (3, 3), "Matrix shape should not change."
     assert (
@@ -80,6 +260,53 @@ def test_validate_graph_sink_source_condition():
     ), "Sink/source vertices should be marked as inactive."
 
 
+@pytest.mark.parametrize("mat_ctor", MAT_CTORS)
+def test_validate_graph_sink_source_condition_cascade(mat_ctor):
+    """Tests that validate_graph_sink_source_condition removes
+    vertices which only become sinks or sources after
+    other vertices are removed."""
+    # A cycle 0 -> 1 -> 0, with a path 1 -> 2 -> 3 -> 4 leading out of it:
+    A = numpy.zeros((5, 5))
+    A[0, 1] = A[1, 0] = A[1, 2] = A[2, 3] = A[3, 4] = 1
+    A[3, 2] = 1
+    validated_A, validated_verts = validate_graph_sink_source_condition(
+        mat_ctor(A)
+    )
+    assert numpy.array_equal(
+        validated_verts, [1, 1, 1, 1, 0]
+    ), "Only the sink should be removed, leaving the two cycles."
+    A[3, 2] = 0
+    validated_A, validated_verts = validate_graph_sink_source_condition(
+        mat_ctor(A)
+    )
+    assert numpy.array_equal(
+        validated_verts, [1, 1, 0, 0, 0]
+    ), "The whole path out of the cycle should be removed."
+    assert numpy.array_equal(
+        numpy.nonzero(_to_dense(validated_A)), ([0, 1], [1, 0])
+    ), "Only the edges of the cycle should remain."
+
+
+@pytest.mark.parametrize("fmt", ["csr", "coo"])
+@pytest.mark.parametrize("v", [None, 2])
+def test_validate_graph_sink_source_condition_sparse(fmt, v):
+    """Tests that validate_graph_sink_source_condition gives the same
+    result for sparse matrices as for numpy arrays."""
+    A = numpy.zeros((5, 5))
+    A[0, 1] = A[1, 0] = A[1, 2] = A[2, 3] = A[3, 4] = 1
+    expected_A, expected_verts = validate_graph_sink_source_condition(A, v=v)
+    validated_A, validated_verts = validate_graph_sink_source_condition(
+        scipy.sparse.csr_array(A).asformat(fmt), v=v
+    )
+    assert validated_A.format == "csr", "Should return a CSR matrix."
+    assert numpy.array_equal(
+        validated_A.toarray(), expected_A
+    ), "Sparse and dense matrices should be validated the same."
+    assert numpy.array_equal(
+        validated_verts, expected_verts
+    ), "Sparse and dense verts should be validated the same."
+
+
 def test_validate_vertices_none():
     """Tests the function validate_vertices with a None."""
     active_verts = numpy.array([[1], [1], [0]])
@@ -116,7 +343,8 @@ def test_validate_vertices_array():
     ), "Should return False for inactive required vertices."
 
 
-def test_zero_rows_and_cols():
+@pytest.mark.parametrize("mat_ctor", MAT_CTORS)
+def test_zero_rows_and_cols(mat_ctor):
     """Tests the function zero_rows_and_cols."""
     mat = numpy.array(
         [
@@ -126,7 +354,7 @@ def test_zero_rows_and_cols():
         ]
     )
     vec = numpy.array([[1], [0], [1]])
-    zeroed_mat = zero_rows_and_cols(mat, vec)
+    zeroed_mat = zero_rows_and_cols(mat_ctor(mat), vec)
     expected_mat = numpy.array(
         [
             [1, 0, 3],
@@ -135,7 +363,7 @@ def test_zero_rows_and_cols():
         ]
     )
     assert numpy.array_equal(
-        zeroed_mat, expected_mat
+        _to_dense(zeroed_mat), expected_mat
     ), "Rows and columns should be zeroed correctly."
 
 
@@ -151,3 +379,76 @@ def test_zero_rows_and_cols_in_place():
     vec = numpy.array([[1], [0], [1]])
     zeroed_mat = zero_rows_and_cols(mat, vec, in_place=True)
     assert zeroed_mat is mat, "Operation should be performed in place."
+
+
+@pytest.mark.parametrize("mat_ctor", MAT_CTORS)
+def test_zero_rows_and_cols_nonbinary_vec(mat_ctor):
+    """Tests that the function zero_rows_and_cols only uses whether
+    the values in the vector are zero, not the values themselves."""
+    mat = numpy.arange(1.0, 10.0).reshape(3, 3)
+    zeroed_mat = zero_rows_and_cols(mat_ctor(mat), numpy.array([2, 0, -1]))
+    expected_mat = numpy.array(
+        [
+            [1.0, 0.0, 3.0],
+            [0.0, 0.0, 0.0],
+            [7.0, 0.0, 9.0],
+        ]
+    )
+    assert numpy.array_equal(
+        _to_dense(zeroed_mat), expected_mat
+    ), "Nonzero values should keep their rows and columns unchanged."
+
+
+@pytest.mark.parametrize("in_place", [False, True])
+def test_zero_rows_and_cols_nonfinite(in_place):
+    """Tests that the function zero_rows_and_cols zeroes infinite and
+    NaN values, and leaves them in the other rows and columns."""
+    mat = numpy.array(
+        [
+            [numpy.inf, numpy.nan, 3.0],
+            [4.0, 5.0, -numpy.inf],
+            [numpy.nan, 8.0, 9.0],
+        ]
+    )
+    zeroed_mat = zero_rows_and_cols(
+        mat, numpy.array([1, 0, 1]), in_place=in_place
+    )
+    expected_mat = numpy.array(
+        [
+            [numpy.inf, 0.0, 3.0],
+            [0.0, 0.0, 0.0],
+            [numpy.nan, 0.0, 9.0],
+        ]
+    )
+    assert numpy.array_equal(
+        zeroed_mat, expected_mat, equal_nan=True
+    ), "Non-finite values should be zeroed like any other value."
+    assert (
+        zeroed_mat is mat
+    ) == in_place, "Only in_place=True should change the matrix."
+
+
+@pytest.mark.parametrize("fmt", ["csr", "coo"])
+@pytest.mark.parametrize("in_place", [False, True])
+def test_zero_rows_and_cols_sparse(fmt, in_place):
+    """Tests the function zero_rows_and_cols on sparse matrices."""
+    dense = numpy.arange(1, 10).reshape(3, 3)
+    mat = scipy.sparse.csr_array(dense).asformat(fmt)
+    zeroed_mat = zero_rows_and_cols(
+        mat, numpy.array([1, 0, 1]), in_place=in_place
+    )
+    expected_mat = numpy.array(
+        [
+            [1, 0, 3],
+            [0, 0, 0],
+            [7, 0, 9],
+        ]
+    )
+    assert zeroed_mat.format == "csr", "Should return a CSR matrix."
+    assert zeroed_mat.nnz == 4, "Zeroed values should not be stored."
+    assert numpy.array_equal(
+        zeroed_mat.toarray(), expected_mat
+    ), "Rows and columns should be zeroed correctly."
+    assert (zeroed_mat is mat) == (
+        in_place and fmt == "csr"
+    ), "Only CSR matrices should be changed in place."
@@ -0,0 +1,49 @@
+"""This file contains tests for the functions in the graph_sparse.py module."""
+
+import numpy
+import scipy.sparse
+
+from kinetic_project.graphs.graph_sparse import (
+    csr_subgraph,
+    prune_sparse,
+    zero_rows_and_cols_sparse,
+)
+
+
+def test_csr_subgraph():
+    """Tests the function csr_subgraph."""
+    A = scipy.sparse.csr_array(numpy.arange(1, 10).reshape(3, 3))
+    # The edges 0 -> 2 and 2 -> 0:
+    sub_A = csr_subgraph(A, numpy.array([0, 1, 1, 2]), numpy.array([2, 0]))
+    assert numpy.array_equal(
+        sub_A.toarray(), [[0, 0, 3], [0, 0, 0], [7, 0, 0]]
+    ), "Subgraph should keep the values of its edges."
+
+
+def test_prune_sparse():
+    """Tests the function prune_sparse."""
+    A = scipy.sparse.csr_array(
+        numpy.array(
+            [
+                [0, 1, 2],
+                [3, 0, 4],
+                [5, 6, 0],
+            ]
+        )
+    )
+    pruned_A = prune_sparse(A, numpy.array([False, True, True]))
+    assert pruned_A.format == "csr", "Should keep the format of the matrix."
+    assert numpy.array_equal(
+        pruned_A.toarray(), [[0, 4], [6, 0]]
+    ), "Pruned matrix should only include kept vertices."
+
+
+def test_zero_rows_and_cols_sparse():
+    """Tests the function zero_rows_and_cols_sparse."""
+    mat = scipy.sparse.csr_array(numpy.arange(1, 5).reshape(2, 2))
+    zeroed_mat = zero_rows_and_cols_sparse(mat, numpy.array([True, False]))
+    assert numpy.array_equal(
+        zeroed_mat.toarray(), [[1, 0], [0, 0]]
+    ), "Rows and columns should be zeroed correctly."
+    assert zeroed_mat.nnz == 1, "Zeroed values should not be stored."
+    assert zeroed_mat is not mat, "Should not modify the matrix by default."
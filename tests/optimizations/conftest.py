@@ -1,7 +1,12 @@
 """This file contains fixtures for use in pytest unit tests for subgradient descent methods."""
 
+import time
+
+import numpy
 import pytest
 
+from kinetic_project.jit import njit
+
 
 # Sample functions for testing:
 def f_square(x: float) -> float:
@@ -52,7 +57,95 @@ def neg_f_square(x: float) -> float:
     return -(x**2)
 
 
-@pytest.fixture
+# The coordinate at which f_branch branches:
+BRANCH_POINT = 0.5
+
+
+def f_branch(x: float) -> float:
+    """Sample function with a branch on x, which
+    only supports a single coordinate.
+
+    Args:
+        x (float): the input to the function.
+
+    Returns:
+        float: The square of x above BRANCH_POINT,
+            and x - BRANCH_POINT**2 otherwise.
+    """
+    if x > BRANCH_POINT:
+        return x**2
+    return x - BRANCH_POINT**2
+
+
+def df_square(x: float) -> float:
+    """Derivative of the sample squared function.
+
+    Args:
+        x (float): the point at which to differentiate.
+
+    Returns:
+        float: The derivative of f_square at x.
+    """
+    return 2 * x
+
+
+def df_abs(x: float) -> float:
+    """Subgradient of the sample abs function.
+
+    Args:
+        x (float): the point at which to differentiate.
+
+    Returns:
+        float: A subgradient of f_abs at x.
+    """
+    return float(numpy.sign(x))
+
+
+def df_cube(x: float) -> float:
+    """Derivative of the sample cubed function.
+
+    Args:
+        x (float): the point at which to differentiate.
+
+    Returns:
+        float: The derivative of f_cube at x.
+    """
+    return 3 * x**2
+
+
+# Seconds for which f_slow_square sleeps on each call:
+SLOW_CALL_TIME = 0.01
+
+
+def f_slow_square(x: float) -> float:
+    """Sample squared function which is slow to evaluate.
+
+    Args:
+        x (float): the number to square.
+
+    Returns:
+        float: The square of x, after SLOW_CALL_TIME seconds.
+    """
+    time.sleep(SLOW_CALL_TIME)
+    return x**2
+
+
+# Compiled version of f_square, for the compiled subgradient descent:
+f_square_jit = njit(f_square)
+# Compiled version of f_branch, which compiles for vectors but
+# fails when called on them:
+f_branch_jit = njit(f_branch)
+
+
+@pytest.fixture(scope="session")
 def funcs():
-    """Sample fixture of functions for subgradient descent tests."""
+    """Sample fixture of functions for subgradient descent tests,
+    shared by all the tests, which must not modify it."""
     return [f_square, f_abs, f_cube]
+
+
+@pytest.fixture(scope="session")
+def grad_funcs():
+    """Sample fixture of the (sub)gradients of the funcs fixture,
+    shared by all the tests, which must not modify it."""
+    return [df_square, df_abs, df_cube]
@@ -1,11 +1,18 @@
 """This file contains tests for the subgradient descent functions."""
 
+import math
+import multiprocessing
+import time
+
 import numpy
 import pytest
 
+from kinetic_project.jit import is_jitted, njit
+from kinetic_project.optimizations import subgradient_methods
 from kinetic_project.optimizations.subgradient_methods import (
     augmented_lagrangian,
     compute_subgradient,
+    compute_subgradient_vec,
     constraint_violation,
     numerical_subgradient,
     objective_function,
@@ -13,44 +20,92 @@ from kinetic_project.optimizations.subgradient_methods import (
     run_single_initialization,
     subgradient_descent,
 )
+from kinetic_project.optimizations.subgradient_methods_batched import (
+    subgradient_descent_batched,
+)
+from kinetic_project.optimizations.subgradient_methods_evaluators import (
+    coordinate_evaluator,
+)
+from kinetic_project.optimizations.subgradient_methods_numba import (
+    FASTMATH_FLAGS,
+    descent_core,
+)
 
-from .conftest import f_abs, f_cube, f_square, neg_f_square
+from .conftest import (
+    f_abs,
+    f_branch,
+    f_branch_jit,
+    f_cube,
+    f_slow_square,
+    f_square,
+    f_square_jit,
+    neg_f_square,
+)
 
 
-def test_objective_function_minimization(funcs):
-    """Tests the objective_function function for minimization."""
+@pytest.mark.parametrize("argmax,sign", [(False, 1), (True, -1)])
+def test_objective_function(funcs, argmax, sign):
+    """Tests the objective_function function for minimization and
+    maximization (argmax=True)."""
     x = numpy.array([0.5, 0.25, 0.25])
-    result = objective_function(x, funcs)
-    expected = 0.5**2 + abs(0.25) + (0.25) ** 3
+    result = objective_function(x, funcs, argmax=argmax)
+    expected = sign * (0.5**2 + abs(0.25) + (0.25) ** 3)
     assert numpy.isclose(
         result, expected
     ), f"Expected {expected}, got {result}."
 
 
-def test_objective_function_maximization(funcs):
-    """Tests the objective_function function with argmax=True."""
-    x = numpy.array([0.5, 0.25, 0.25])
-    result = objective_function(x, funcs, argmax=True)
-    expected = -(0.5**2 + abs(0.25) + (0.25) ** 3)
+@pytest.mark.parametrize("f", [f_square, math.fabs])
+def test_objective_function_identical_funcs(f):
+    """Tests the objective_function function when all functions are the same,
+    both for a function which supports numpy arrays and one which does not."""
+    x = numpy.array([0.5, -0.25, 0.25])
+    result = objective_function(x, [f] * 3)
+    expected = f(0.5) + f(-0.25) + f(0.25)
     assert numpy.isclose(
         result, expected
     ), f"Expected {expected}, got {result}."
 
 
-def test_constraint_violation_satisfied():
-    """Tests the constraint_violation function for correct satisfaction."""
-    x = numpy.array([0.5, 0.25, 0.25])
+@pytest.mark.parametrize("n", [3, 300])
+def test_objective_function_many_funcs(funcs, n):
+    """Tests the objective_function function with different functions,
+    both with few functions (generated code) and many (a numpy ufunc)."""
+    many_funcs = (funcs * n)[:n]
+    x = numpy.linspace(-1, 1, n)
+    result = objective_function(x, many_funcs)
+    expected = sum(f(x_i) for f, x_i in zip(many_funcs, x))
     assert numpy.isclose(
-        constraint_violation(x), 0
-    ), "Constraint should be satisfied."
+        result, expected
+    ), f"Expected {expected}, got {result}."
 
 
-def test_constraint_violation_unsatisfied():
-    """Tests the constraint_violation function for incorrect satisfaction."""
-    x = numpy.array([0.6, 0.4, 0.2])
+def test_objective_function_cached_evaluator(funcs):
+    """Tests that objective_function builds the evaluator of the same
+    functions only once."""
+    x = numpy.array([0.5, 0.25, 0.25])
+    objective_function(x, funcs)
+    misses = coordinate_evaluator.cache_info().misses
+    objective_function(x, list(funcs), argmax=True)
+    assert (
+        coordinate_evaluator.cache_info().misses == misses
+    ), "The evaluator of the same functions should be reused."
+
+
+@pytest.mark.parametrize(
+    "x,expected",
+    [
+        (numpy.array([0.5, 0.25, 0.25]), 0.0),
+        (numpy.array([0.6, 0.4, 0.2]), 0.2),
+    ],
+)
+def test_constraint_violation(x, expected):
+    """Tests the constraint_violation function, both for a satisfied and an
+    unsatisfied constraint."""
+    result = constraint_violation(x)
     assert numpy.isclose(
-        constraint_violation(x), 0.2
-    ), "Constraint violation incorrect."
+        result, expected
+    ), f"Expected {expected}, got {result}."
 
 
 def test_augmented_lagrangian(funcs):
@@ -66,42 +121,92 @@ def test_augmented_lagrangian(funcs):
     ), f"Expected {expected}, got {result}."
 
 
-def test_numerical_subgradient():
-    """Tests for the numerical_subgradient function."""
-    x = 0.5
-    epsilon = 1e-6
-    result = numerical_subgradient(f_square, x, epsilon)
-    expected = (f_square(x + epsilon) - f_square(x)) / epsilon
+@pytest.mark.parametrize("argmax,sign", [(False, 1), (True, -1)])
+def test_augmented_lagrangian_violated(funcs, argmax, sign):
+    """Tests the augmented_lagrangian function at a point which
+    violates the constraint, against its closed form."""
+    x = numpy.array([0.5, 0.5, 0.25])
+    lambd = 1.0
+    rho = 10.0
+    result = augmented_lagrangian(x, funcs, lambd, rho, argmax=argmax)
+    objective = sign * (0.5**2 + abs(0.5) + 0.25**3)
+    c = 0.25
+    expected = objective + lambd * c + 0.5 * rho * c**2
     assert numpy.isclose(
         result, expected
     ), f"Expected {expected}, got {result}."
 
 
+@pytest.mark.parametrize(
+    "f,x,expected",
+    [
+        # The derivatives of x**2, abs(x) and x**3:
+        (f_square, 0.5, 2 * 0.5),
+        (f_abs, -0.5, -1.0),
+        (f_cube, 0.25, 3 * 0.25**2),
+        # The mean of the one-sided slopes of abs(x) at its kink:
+        (f_abs, 0.0, 0.0),
+    ],
+)
+def test_numerical_subgradient(f, x, expected):
+    """Tests for the numerical_subgradient function, which should
+    match the derivative up to the error of the central difference."""
+    epsilon = 1e-6
+    result = numerical_subgradient(f, x, epsilon)
+    numpy.testing.assert_allclose(result, expected, rtol=0, atol=1e-8)
+
+
 def test_numerical_subgradient_maximized():
     """Tests for the numerical_subgradient function with argmax=True."""
     x = 0.5
     epsilon = 1e-6
     result = numerical_subgradient(neg_f_square, x, epsilon, argmax=True)
-    expected = -(neg_f_square(x + epsilon) - neg_f_square(x)) / epsilon
-    assert numpy.isclose(
-        result, expected
-    ), f"Expected {expected}, got {result}."
+    # The derivative of x**2, the inverted -x**2:
+    expected = 2 * x
+    numpy.testing.assert_allclose(result, expected, rtol=1e-4, atol=1e-4)
 
 
 def test_compute_subgradient(funcs):
     """Tests for the compute_subgradient function."""
     x = numpy.array([0.5, -0.5, 0.25])
     result = compute_subgradient(x, funcs)
-    expected = numpy.array(
-        [
-            numerical_subgradient(f_square, 0.5),
-            numerical_subgradient(f_abs, -0.5),
-            numerical_subgradient(f_cube, 0.25),
-        ]
-    )
-    assert numpy.allclose(
+    # The derivatives of x**2, abs(x) and x**3:
+    expected = numpy.array([2 * 0.5, -1.0, 3 * 0.25**2])
+    numpy.testing.assert_allclose(result, expected, rtol=1e-4, atol=1e-4)
+
+
+def test_compute_subgradient_grad_funcs(funcs, grad_funcs):
+    """Tests the compute_subgradient function with analytic gradients."""
+    x = numpy.array([0.5, -0.5, 0.25])
+    result = compute_subgradient(x, funcs, grad_funcs=grad_funcs)
+    expected = numpy.array([1.0, -1.0, 0.1875])
+    assert numpy.array_equal(
         result, expected
     ), f"Expected {expected}, got {result}."
+    result = compute_subgradient(x, funcs, argmax=True, grad_funcs=grad_funcs)
+    assert numpy.array_equal(
+        result, -expected
+    ), f"Expected {-expected}, got {result}."
+
+
+def test_compute_subgradient_vec():
+    """Tests for the compute_subgradient_vec function, which should
+    match the derivative up to the error of the central difference."""
+    x = numpy.array([0.5, -0.5, 0.25])
+    result = compute_subgradient_vec(x, f_square)
+    assert numpy.allclose(
+        result, 2 * x, rtol=0, atol=1e-8
+    ), f"Expected {2 * x}, got {result}."
+    result = compute_subgradient_vec(x, f_square, sign=-1.0)
+    assert numpy.allclose(
+        result, -2 * x, rtol=0, atol=1e-8
+    ), f"Expected {-2 * x}, got {result}."
+    out = numpy.empty(3)
+    result = compute_subgradient_vec(x, f_square, out=out)
+    assert result is out, "The subgradient should be written into out."
+    assert numpy.allclose(
+        out, 2 * x, rtol=0, atol=1e-8
+    ), f"Expected {2 * x}, got {out}."
 
 
 def test_subgradient_descent_convergence(funcs):
@@ -116,22 +221,316 @@ def test_subgradient_descent_convergence(funcs):
     assert len(history) <= max_iter, "Exceeded max iterations."
 
 
-def test_run_single_initialization(funcs):
-    """Tests for the run_single_initialization function."""
+def test_subgradient_descent_grad_funcs(funcs, grad_funcs):
+    """Tests that the subgradient_descent function with analytic
+    gradients matches the one with estimated subgradients."""
+    x_0 = numpy.array([0.5, 0.25, 0.25])
+    result, objective, _, _ = subgradient_descent(funcs, x_0, max_iter=500)
+    grad_result, grad_objective, _, _ = subgradient_descent(
+        funcs, x_0, max_iter=500, grad_funcs=grad_funcs
+    )
+    assert numpy.allclose(
+        grad_result, result, atol=1e-6
+    ), f"Expected {result}, got {grad_result}."
+    assert numpy.isclose(
+        grad_objective, objective
+    ), f"Expected {objective}, got {grad_objective}."
+
+
+def test_subgradient_descent_unknown_backend(funcs):
+    """Tests that subgradient_descent rejects an unknown backend."""
+    with pytest.raises(ValueError):
+        subgradient_descent(funcs, max_iter=10, backend="torch")
+
+
+@pytest.mark.parametrize(
+    "backend, inner_solver", [("numpy", "newton"), ("jax", "lbfgs")]
+)
+def test_subgradient_descent_unknown_inner_solver(
+    funcs, backend, inner_solver
+):
+    """Tests that subgradient_descent rejects an unsupported inner solver."""
+    with pytest.raises(ValueError):
+        subgradient_descent(
+            funcs, max_iter=10, backend=backend, inner_solver=inner_solver
+        )
+
+
+@pytest.mark.parametrize(
+    "f, argmax", [(f_square, False), (neg_f_square, True)]
+)
+def test_subgradient_descent_lbfgs(f, argmax, grad_funcs):
+    """Tests that the subgradient_descent function with the L-BFGS-B
+    inner solver finds the optimum of sum(x_i**2) on the simplex
+    (its center), minimizing it or maximizing its negative."""
+    x_0 = numpy.array([0.5, 0.25, 0.25])
+    expected = numpy.ones(3) / 3
+    tol = 1e-6
+    grad = grad_funcs[0] if f is f_square else lambda x: -2 * x
+    for kwargs in ({}, {"grad_funcs": [grad] * 3}):
+        result, objective, _, history = subgradient_descent(
+            [f] * 3,
+            x_0,
+            tol=tol,
+            argmax=argmax,
+            inner_solver="lbfgs",
+            **kwargs,
+        )
+        assert abs(constraint_violation(result)) < tol, "Constraint not met."
+        assert numpy.allclose(
+            result, expected, atol=1e-5
+        ), f"Expected {expected}, got {result}."
+        assert numpy.isclose(
+            objective, history[-1]["objective"]
+        ), "The last history entry should be the result."
+
+
+def test_subgradient_descent_jax():
+    """Tests that the subgradient_descent function with the jax backend
+    matches the numpy backend, up to the float32 precision of jax."""
+    jnp = pytest.importorskip("jax.numpy")
+    x_0 = numpy.array([0.5, 0.25, 0.25])
+    result, objective, _, history = subgradient_descent(
+        [f_square, f_abs, f_cube], x_0, max_iter=500, log_every=7
+    )
+    jax_result, jax_objective, _, jax_history = subgradient_descent(
+        [f_square, jnp.abs, f_cube],
+        x_0,
+        max_iter=500,
+        log_every=7,
+        backend="jax",
+    )
+    assert numpy.allclose(
+        jax_result, result, atol=1e-3
+    ), f"Expected {result}, got {jax_result}."
+    assert numpy.isclose(
+        jax_objective, objective, atol=1e-3
+    ), f"Expected {objective}, got {jax_objective}."
+    assert [h["iteration"] for h in jax_history] == [
+        h["iteration"] for h in history
+    ], "The same iterations should be recorded."
+
+
+def test_subgradient_descent_without_history(funcs):
+    """Tests the subgradient_descent function with return_history=False."""
+    x_0 = numpy.array([0.5, 0.25, 0.25])
+    result, objective, _, history = subgradient_descent(
+        funcs, x_0.copy(), max_iter=500
+    )
+    (
+        result_no_history,
+        objective_no_history,
+        _,
+        no_history,
+    ) = subgradient_descent(
+        funcs, x_0.copy(), max_iter=500, return_history=False
+    )
+    assert no_history == [], "No history should be returned."
+    assert numpy.array_equal(result, result_no_history), "Results differ."
+    assert objective == objective_no_history, "Objectives differ."
+    assert numpy.array_equal(
+        history[-1]["x"], result
+    ), "The last history entry should be the result."
+
+
+@pytest.mark.parametrize("f", [f_square, f_square_jit])
+def test_subgradient_descent_log_every(f):
+    """Tests that the subgradient_descent function only records every
+    log_every iterations, and the last one."""
+    x_0 = numpy.array([0.5, 0.25, 0.25])
+    _, _, _, history = subgradient_descent([f] * 3, x_0.copy(), max_iter=500)
+    _, _, _, logged_history = subgradient_descent(
+        [f] * 3, x_0.copy(), max_iter=500, log_every=10
+    )
+    iterations = [h["iteration"] for h in logged_history]
+    assert iterations[:-1] == list(
+        range(0, history[-1]["iteration"], 10)
+    ), "Every 10th iteration should be recorded."
+    assert (
+        iterations[-1] == history[-1]["iteration"]
+    ), "The last iteration should be recorded."
+    assert numpy.isclose(
+        logged_history[-1]["objective"], history[-1]["objective"]
+    ), "The last objective should match."
+
+
+@pytest.mark.parametrize("argmax", [False, True])
+def test_subgradient_descent_compiled_funcs(funcs, argmax):
+    """Tests that the subgradient_descent function gives the same
+    results with different compiled functions as with python ones."""
+    x_0 = numpy.array([0.5, 0.25, 0.25])
+    result, objective, lambd, _ = subgradient_descent(
+        funcs, x_0, max_iter=500, argmax=argmax
+    )
+    result_jit, objective_jit, lambd_jit, _ = subgradient_descent(
+        [njit(f) for f in funcs], x_0, max_iter=500, argmax=argmax
+    )
+    assert numpy.allclose(result, result_jit), "Results should match."
+    assert numpy.isclose(objective, objective_jit), "Objectives should match."
+    assert numpy.isclose(lambd, lambd_jit), "Multipliers should match."
+
+
+@pytest.mark.parametrize("argmax", [False, True])
+def test_subgradient_descent_compiled(argmax):
+    """Tests that the subgradient_descent function gives the same
+    results with a compiled function as with a python function."""
+    x_0 = numpy.array([0.5, 0.25, 0.25])
+    result, objective, lambd, history = subgradient_descent(
+        [f_square] * 3, x_0.copy(), max_iter=500, argmax=argmax
+    )
+    (
+        result_jit,
+        objective_jit,
+        lambd_jit,
+        history_jit,
+    ) = subgradient_descent(
+        [f_square_jit] * 3, x_0.copy(), max_iter=500, argmax=argmax
+    )
+    assert numpy.allclose(result, result_jit), "Results should match."
+    assert numpy.isclose(objective, objective_jit), "Objectives should match."
+    assert numpy.isclose(lambd, lambd_jit), "Multipliers should match."
+    assert len(history) == len(history_jit), "Histories should match."
+    assert all(
+        numpy.allclose(h["x"], h_jit["x"])
+        and numpy.isclose(h["objective"], h_jit["objective"])
+        for h, h_jit in zip(history, history_jit)
+    ), "Histories should match."
+
+
+@pytest.mark.parametrize("compile_funcs", [False, True])
+def test_subgradient_descent_compiled_coordinate_func(compile_funcs):
+    """Tests that the subgradient_descent function calls the same compiled
+    function of a single coordinate once per coordinate, as it does not
+    support vectors, and gives the same results as python."""
+    x_0 = numpy.array([0.5, 0.25, 0.25])
+    result, objective, _, _ = subgradient_descent(
+        [f_branch] * 3, x_0.copy(), max_iter=500
+    )
+    result_jit, objective_jit, _, _ = subgradient_descent(
+        [f_branch_jit] * 3,
+        x_0.copy(),
+        max_iter=500,
+        compile_funcs=compile_funcs,
+    )
+    assert numpy.allclose(result, result_jit), "Results should match."
+    assert numpy.isclose(objective, objective_jit), "Objectives should match."
+
+
+@pytest.mark.skipif(
+    not is_jitted(f_square_jit), reason="Only compiled code uses fast math."
+)
+def test_descent_core_fastmath():
+    """Tests that the compiled loop does not assume that there are no
+    infinities or NaNs, as it compares against an infinite |c|."""
+    assert (
+        descent_core.targetoptions["fastmath"] == FASTMATH_FLAGS
+    ), "The compiled loop should use the fast math flags."
+    assert not FASTMATH_FLAGS & {
+        "nnan",
+        "ninf",
+    }, "The fast math flags should keep infinities and NaNs."
+
+
+@pytest.mark.parametrize(
+    "funcs_to_compile, compilable",
+    [
+        ([f_square] * 3, True),
+        ([math.fabs] * 3, False),
+        ([f_square, f_abs, f_cube], True),
+        ([f_square, math.fabs, f_cube], False),
+    ],
+)
+def test_subgradient_descent_compile_funcs(
+    mocker, funcs_to_compile, compilable
+):
+    """Tests that the subgradient_descent function with compile_funcs=True
+    runs compiled code for functions numba compiles, falls back to
+    python otherwise, and gives the same results either way."""
+    spy = mocker.spy(subgradient_methods, "_subgradient_descent_compiled")
+    x_0 = numpy.array([0.5, 0.25, 0.25])
+    result, objective, _, _ = subgradient_descent(
+        funcs_to_compile, x_0, max_iter=500
+    )
+    result_compiled, objective_compiled, _, _ = subgradient_descent(
+        funcs_to_compile, x_0, max_iter=500, compile_funcs=True
+    )
+    # Without numba, nothing is compiled:
+    compiles = compilable and is_jitted(f_square_jit)
+    assert spy.call_count == (
+        1 if compiles else 0
+    ), "Only functions numba compiles should run compiled code."
+    assert numpy.allclose(result, result_compiled), "Results should match."
+    assert numpy.isclose(
+        objective, objective_compiled
+    ), "Objectives should match."
+
+
+@pytest.mark.parametrize("argmax", [False, True])
+def test_subgradient_descent_batched(funcs, argmax):
+    """Tests that each row of subgradient_descent_batched matches
+    subgradient_descent from the same initial point."""
+    x_0 = numpy.random.default_rng(0).dirichlet(numpy.ones(3), size=4) * 1.2
+    result, objectives, lambdas = subgradient_descent_batched(
+        funcs, x_0, max_iter=500, argmax=argmax
+    )
+    for i, x_0_row in enumerate(x_0):
+        expected, objective, lambd, _ = subgradient_descent(
+            funcs, x_0_row, max_iter=500, argmax=argmax
+        )
+        assert numpy.allclose(
+            result[i], expected
+        ), f"Expected {expected}, got {result[i]}."
+        assert numpy.isclose(
+            objectives[i], objective
+        ), f"Expected {objective}, got {objectives[i]}."
+        assert numpy.isclose(
+            lambdas[i], lambd
+        ), f"Expected {lambd}, got {lambdas[i]}."
+
+
+def test_subgradient_descent_batched_converged_row():
+    """Tests that subgradient_descent_batched leaves a converged row in
+    place when its subgradient is not finite, while another row is still
+    moving."""
+    # The first row converges to [1, 0] in one step, where the finite
+    # difference of the square root is NaN:
+    x_0 = numpy.array([[1.5, 0.001], [0.3, 0.3]])
+    with numpy.errstate(invalid="ignore"):
+        result, _, _ = subgradient_descent_batched(
+            [numpy.sqrt] * 2, x_0, max_iter=50
+        )
+    assert numpy.array_equal(
+        result[0], [1.0, 0.0]
+    ), f"Expected the converged row to stay at [1, 0], got {result[0]}."
+    assert numpy.all(
+        numpy.isfinite(result[1])
+    ), f"Expected the other row to stay finite, got {result[1]}."
+
+
+# The warmup rounds leave the compilation of the kernels out of the timings:
+@pytest.mark.benchmark(group="descent", warmup=True, warmup_iterations=2)
+def test_run_single_initialization(benchmark, funcs):
+    """Tests for the run_single_initialization function, timing
+    each run with pytest-benchmark."""
     x_0 = numpy.array([0.5, 0.25, 0.25])
     args = (funcs, x_0, {"max_iter": 500, "tol": 1e-6})
-    result, _, _, _ = run_single_initialization(args)
+    result, _, _, _ = benchmark(run_single_initialization, args)
     assert (
         abs(constraint_violation(result)) < args[2]["tol"]
     ), "Constraint not satisfied."
 
 
-def test_run_multiple_initializations_parallel(funcs):
+@pytest.mark.xdist_group("process_pools")
+def test_run_multiple_initializations_parallel(funcs, max_workers):
     """Tests for the run_multiple_initializations_parallel function."""
     num_starts = 10
     tol = 1e-6
     best_solution, all_solutions = run_multiple_initializations_parallel(
-        funcs, num_starts=num_starts, max_workers=4, max_iter=500, tol=tol
+        funcs,
+        num_starts=num_starts,
+        max_workers=max_workers,
+        max_iter=500,
+        tol=tol,
     )
     best_x, _, _, _ = best_solution
     assert (
@@ -142,15 +541,194 @@ def test_run_multiple_initializations_parallel(funcs):
     ), "Not all initializations were run."
 
 
+@pytest.mark.xdist_group("process_pools")
+def test_run_multiple_initializations_parallel_seed(funcs, max_workers):
+    """Tests that run_multiple_initializations_parallel is reproducible with a seed."""
+    results = [
+        run_multiple_initializations_parallel(
+            funcs,
+            num_starts=4,
+            max_workers=max_workers,
+            max_iter=50,
+            seed=seed,
+        )[1]
+        for seed in (0, 0, 1)
+    ]
+    starts = [[r[3][0]["x"] for r in result] for result in results]
+    assert numpy.array_equal(
+        starts[0], starts[1]
+    ), "The same seed should give the same initializations."
+    assert not numpy.array_equal(
+        starts[0], starts[2]
+    ), "Different seeds should give different initializations."
+
+
+@pytest.mark.xdist_group("process_pools")
+def test_run_multiple_initializations_parallel_patience(funcs, max_workers):
+    """Tests that run_multiple_initializations_parallel stops early."""
+    min_starts = 2
+    best, results = run_multiple_initializations_parallel(
+        funcs,
+        num_starts=8,
+        max_workers=max_workers,
+        min_starts=min_starts,
+        patience=0,
+    )
+    assert (
+        len(results) == min_starts
+    ), "Expected to stop after min_starts results."
+    assert best[1] == min(
+        r[1] for r in results
+    ), "Best result should be the minimum of the finished results."
+
+
+@pytest.mark.xdist_group("process_pools")
+def test_run_multiple_initializations_parallel_patience_returns_early():
+    """Tests that run_multiple_initializations_parallel returns once it
+    stops early, without waiting for the other initializations."""
+    slow_funcs = [f_slow_square] * 3
+    kwargs = {"max_iter": 20, "tol": 0.0, "return_history": False}
+    start_time = time.perf_counter()
+    run_multiple_initializations_parallel(
+        slow_funcs, num_starts=1, max_workers=1, **kwargs
+    )
+    one_start_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    _, results = run_multiple_initializations_parallel(
+        slow_funcs,
+        num_starts=4,
+        max_workers=1,
+        min_starts=1,
+        patience=0,
+        **kwargs,
+    )
+    early_stop_time = time.perf_counter() - start_time
+    assert len(results) == 1, "Expected to stop after min_starts results."
+    assert (
+        early_stop_time < 2 * one_start_time
+    ), "Expected to return without waiting for the other initializations."
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() in {"spawn", "forkserver"},
+    reason="Lambdas can only be sent to forked workers.",
+)
+@pytest.mark.xdist_group("process_pools")
+def test_run_multiple_initializations_parallel_lambdas(max_workers):
+    """Tests the run_multiple_initializations_parallel function with
+    functions which cannot be pickled."""
+    lambda_funcs = [lambda x: x**2, lambda x: -x, lambda x: x**3]
+    num_starts = 4
+    tol = 1e-6
+    best_solution, all_solutions = run_multiple_initializations_parallel(
+        lambda_funcs,
+        num_starts=num_starts,
+        max_workers=max_workers,
+        max_iter=500,
+        tol=tol,
+    )
+    assert (
+        abs(constraint_violation(best_solution[0])) < tol
+    ), "Best solution does not satisfy constraint."
+    assert (
+        len(all_solutions) == num_starts
+    ), "Not all initializations were run."
+
+
+@pytest.mark.skipif(
+    not is_jitted(f_square_jit), reason="The numba backend requires numba."
+)
+@pytest.mark.parametrize("argmax", [False, True])
+@pytest.mark.xdist_group("process_pools")
+def test_run_multiple_initializations_numba(argmax, max_workers):
+    """Tests that the numba backend of run_multiple_initializations_parallel
+    gives the results of the process pool."""
+    jitted_funcs = [njit(f) for f in (f_square, f_abs, f_cube)]
+    results = [
+        run_multiple_initializations_parallel(
+            jitted_funcs,
+            num_starts=4,
+            max_workers=max_workers,
+            seed=0,
+            max_iter=300,
+            argmax=argmax,
+            log_every=10,
+            parallel_backend=parallel_backend,
+        )
+        for parallel_backend in ("mp", "numba")
+    ]
+    assert numpy.isclose(
+        results[0][0][1], results[1][0][1]
+    ), "Both backends should find the same best objective."
+    for mp_result, numba_result in zip(results[0][1], results[1][1]):
+        assert numpy.allclose(
+            mp_result[0], numba_result[0]
+        ), "Both backends should find the same x."
+        assert [entry["iteration"] for entry in mp_result[3]] == [
+            entry["iteration"] for entry in numba_result[3]
+        ], "Both backends should log the same iterations."
+
+
+def test_run_multiple_initializations_numba_uncompiled(funcs):
+    """Tests that the numba backend of run_multiple_initializations_parallel
+    rejects functions which are not compiled."""
+    with pytest.raises(ValueError, match="compiled functions"):
+        run_multiple_initializations_parallel(
+            funcs, num_starts=2, parallel_backend="numba"
+        )
+
+
+def test_run_multiple_initializations_unknown_backend(funcs):
+    """Tests that run_multiple_initializations_parallel rejects an unknown
+    parallel backend."""
+    with pytest.raises(ValueError, match="parallel backend"):
+        run_multiple_initializations_parallel(
+            funcs, num_starts=2, parallel_backend="threads"
+        )
+
+
 @pytest.mark.slow
-def test_parallel_scalability(funcs):
+@pytest.mark.xdist_group("process_pools")
+def test_parallel_scalability(funcs, max_workers):
     """Tests the scalability of the parallelization implementation.
     Can be skipped with `-m "not slow"` flag.
     """
     num_starts = 50
     _, all_solutions = run_multiple_initializations_parallel(
-        funcs, num_starts=num_starts, max_workers=8, max_iter=500, tol=1e-6
+        funcs,
+        num_starts=num_starts,
+        max_workers=max_workers,
+        max_iter=500,
+        tol=1e-6,
     )
     assert (
         len(all_solutions) == num_starts
     ), "Not all initializations were run."
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(
+    not is_jitted(f_square_jit), reason="The numba backend requires numba."
+)
+@pytest.mark.xdist_group("process_pools")
+def test_run_multiple_initializations_numba_prange():
+    """Tests the prange loop of the numba backend of
+    run_multiple_initializations_parallel, which runs even for little work
+    with min_work_per_thread=0. Can be skipped with `-m "not slow"` flag.
+    """
+    jitted_funcs = [njit(f) for f in (f_square, f_abs, f_cube)]
+    results = [
+        run_multiple_initializations_parallel(
+            jitted_funcs,
+            num_starts=4,
+            seed=0,
+            max_iter=300,
+            parallel_backend="numba",
+            min_work_per_thread=min_work_per_thread,
+        )[1]
+        for min_work_per_thread in (0, 10**9)
+    ]
+    for parallel_result, serial_result in zip(*results):
+        assert numpy.allclose(
+            parallel_result[0], serial_result[0]
+        ), "The parallel and serial loops should find the same x."